@@ -0,0 +1,57 @@
+"""
+Numba compiled kernels for the selection hot loops.
+
+Importing this module raises ImportError when numba is not installed, the selectors then fall back to their numpy
+implementation. The kernels are cached on disk, so they are compiled only once.
+"""
+import numba
+import numpy as np
+
+
+@numba.njit(cache=True, parallel=True)
+def tournament_kernel(fitness, contestants):
+    """
+    Winner of every tournament, scanning each row of contestants once instead of gathering their fitness.
+
+    :param fitness: fitness of the population
+    :param contestants: matrix with one row of population indices per tournament
+    :return: population index of the winner of each tournament, the first one on ties
+    """
+    winners = np.empty(contestants.shape[0], dtype=np.int64)
+    for i in numba.prange(contestants.shape[0]):
+        winner = contestants[i, 0]
+        for j in range(1, contestants.shape[1]):
+            contestant = contestants[i, j]
+            if fitness[contestant] > fitness[winner]:
+                winner = contestant
+        winners[i] = winner
+    return winners
+
+
+@numba.njit(cache=True, parallel=True)
+def roulette_kernel(fitness, cumulative_fitness, first_parents, draws):
+    """
+    Second parents of a roulette wheel with incest prevention, each one spun on the wheel without its first parent.
+
+    :param fitness: fitness of the population
+    :param cumulative_fitness: cumulative sum of the fitness
+    :param first_parents: population index of the first parent of each couple
+    :param draws: one uniform random number in [0, 1) per couple
+    :return: population index of the second parent of each couple
+    """
+    size = fitness.shape[0]
+    total_fitness = cumulative_fitness[size - 1]
+    second_parents = np.empty(first_parents.shape[0], dtype=np.int64)
+    for i in numba.prange(first_parents.shape[0]):
+        first_parent = first_parents[i]
+        first_fitness = fitness[first_parent]
+        position = draws[i] * (total_fitness - first_fitness)
+        # the positions past the slice of the first parent are moved after it
+        if position > cumulative_fitness[first_parent] - first_fitness:
+            position += first_fitness
+        second_parent = min(np.searchsorted(cumulative_fitness, position), size - 1)
+        # a wheel without any weight left, e.g. when all the fitness values are 0, can still point to the first parent
+        if second_parent == first_parent:
+            second_parent = (first_parent + 1) % size
+        second_parents[i] = second_parent
+    return second_parents
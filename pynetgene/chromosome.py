@@ -1,4 +1,3 @@
-import random
 from abc import ABC, abstractmethod
 from typing import List, TypeVar, Generic
 
@@ -6,24 +5,96 @@ from pynetgene.exception import GaException
 from pynetgene.gene import BitGene
 from pynetgene.gene import IntegerGene
 from pynetgene.gene import FloatGene
+from pynetgene.utils import get_rng
 import copy
 import numbers
 
+import numpy as np
+
 # Defining a Gene type variable
 #G = TypeVar("G", bound="Gene")
 # Define a type variable that can be any subclass of `numbers.Number`
 N = TypeVar('N', bound=numbers.Number)
 
+_INT32_INFO = np.iinfo(np.int32)
+
+
+def _validate_bulk(values, dtype, kinds, message):
+    # validate a whole batch of alleles once through the array dtype instead of every value with isinstance
+    values = np.asarray(values)
+    if values.size and values.dtype.kind not in kinds:
+        if dtype is not np.bool_ or values.dtype.kind not in "iu" or not np.isin(values, (0, 1)).all():
+            raise ValueError(message)
+    return values.astype(dtype, copy=False)
+
+
 class Chromosome(ABC):
+    # no per-instance __dict__: populations hold many chromosomes
+    __slots__ = ('_genes', '_alleles', '_buffer')
 
     def __init__(self):
         self._genes = []
+        self._alleles = None
+        # spare capacity used by add_gene, the genes are a view over its first part
+        self._buffer = None
 
-    def get_gene(self, index: int):
-        return self._genes[index]
+    @property
+    def alleles(self) -> np.ndarray:
+        """
+        Alleles of the chromosome as a numpy array.
+
+        The array is built on first access and cached until the chromosome is modified through its methods,
+        so fitness functions can read all the alleles at once instead of calling get_gene for every index.
+        It must be treated as read-only.
+        """
+        if self._alleles is None:
+            self._alleles = np.asarray(self._genes)
+        return self._alleles
+
+    @classmethod
+    def _from_genes(cls, genes):
+        # build a chromosome around an existing gene array, skipping the subclass __init__ and its random initialisation
+        chromosome = cls.__new__(cls)
+        Chromosome.__init__(chromosome)
+        chromosome._genes = genes
+        return chromosome
+
+    def _append(self, gene):
+        # append in amortized constant time: the buffer doubles when full instead of copying the genes on every call.
+        # _buffer keeps the buffer and the genes view last built over it, any other genes array needs a new buffer
+        genes = self._genes
+        size = len(genes)
+        if self._buffer is not None and self._buffer[1] is genes and size < len(self._buffer[0]):
+            buffer = self._buffer[0]
+        else:
+            buffer = np.empty(max(2 * size, 8), dtype=genes.dtype)
+            buffer[:size] = genes
+        buffer[size] = gene
+        self._genes = buffer[:size + 1]
+        self._buffer = (buffer, self._genes)
+        self._alleles = None
+
+    def _reserve(self, size_hint, dtype):
+        # empty genes over a buffer with room for size_hint genes, add_gene fills it without reallocating
+        buffer = np.empty(size_hint, dtype=dtype)
+        self._genes = buffer[:0]
+        self._buffer = (buffer, self._genes)
+
+    def _extend(self, values, dtype, kinds, message):
+        self._genes = np.concatenate((self._genes, _validate_bulk(values, dtype, kinds, message).ravel()))
+        self._alleles = None
+
+    def fingerprint(self) -> bytes:
+        """
+        Raw bytes of the genes, usable as a key to recognise chromosomes with the same genes.
+
+        :return: bytes of the gene array
+        """
+        return self._genes.tobytes()
 
-    def length(self) -> int:
-        return len(self._genes)
+    def get_gene(self, index: int):
+        # item returns a python scalar instead of a numpy scalar
+        return self._genes.item(index)
 
     def contains(self, gene) -> bool:
         return gene in self._genes
@@ -56,22 +127,31 @@ class Chromosome(ABC):
 
     def __setitem__(self, index, value):
         self._genes[index] = value
+        self._alleles = None
 
     def __len__(self):
         return len(self._genes)
 
+    # kept for compatibility, len(chromosome) avoids the extra method lookup
+    length = __len__
+
     def __str__(self):  # Centralized the __str__ method
         return f"Chromosome:\n" + "\n".join([f"Gene {i} = {gene}" for i, gene in enumerate(self._genes)])
 
 
 class BitChromosome(Chromosome):
-    def __init__(self, size=None):
+    __slots__ = ()
+
+    def __init__(self, size=None, size_hint=None):
         super().__init__()
 
+        # the genes are stored in a numpy bool array, one byte per gene instead of a boxed bool per list item
         if size is not None:
-            self._genes = [random.choice([True, False]) for _ in range(size)]
+            self._genes = get_rng().integers(0, 2, size=size).astype(np.bool_)
+        elif size_hint:
+            self._reserve(size_hint, np.bool_)
         else:
-            self._genes = []
+            self._genes = np.empty(0, dtype=np.bool_)
 
     @property
     def genes(self):
@@ -79,48 +159,95 @@ class BitChromosome(Chromosome):
 
     @genes.setter
     def genes(self, genes: []):
-        self._genes = genes
+        self._genes = _validate_bulk(genes, np.bool_, "b", "alleles must be boolean values (True or False)")
+        self._alleles = None
 
     def add_gene(self, gene: bool):
-        if gene is not None and not isinstance(gene, bool):
+        if gene is not None and not isinstance(gene, (bool, np.bool_)):
             raise ValueError("allele must be a boolean value (True or False)")
-        self._genes.append(gene)
+        self._append(gene)
+
+    def extend_genes(self, values):
+        """
+        Append several genes at once, faster than calling add_gene for each of them.
+
+        :param values: iterable of boolean values
+        """
+        self._extend(values, np.bool_, "b", "alleles must be boolean values (True or False)")
 
     def set_gene(self, index: int, gene: bool):
-        if gene is not None and not isinstance(gene, bool):
+        if gene is not None and not isinstance(gene, (bool, np.bool_)):
             raise ValueError("allele must be a boolean value (True or False)")
         self._genes[index] = gene
+        self._alleles = None
 
     def insert_gene(self, index: int, gene: bool):
-        if not isinstance(gene, BitGene):
-            raise ValueError("Only BitGene can be added to a BitChromosome")
-        self._genes.insert(index, gene)
+        if not isinstance(gene, (bool, np.bool_)):
+            raise ValueError("allele must be a boolean value (True or False)")
+        self._genes = np.insert(self._genes, index, gene)
+        self._alleles = None
 
     def to_list(self) -> List[bool]:
-        return self._genes
+        return self._genes.tolist()
+
+    def bit_count(self) -> int:
+        """
+        Count the genes set to True.
+
+        The count runs in a single C-level pass over the genes, which makes it the fastest way to compute
+        "number of ones" fitness functions.
+
+        :return: number of True genes
+        """
+        return int(np.count_nonzero(self._genes))
 
     def copy(self) -> 'BitChromosome':
-        new_chromosome = BitChromosome()
-        # Since the list contains only boolean values, a shallow copy is sufficient
-        new_chromosome._genes = self._genes.copy()
-        return new_chromosome
+        return BitChromosome._from_genes(self._genes.copy())
 
 
 class NumericChromosome(Chromosome, Generic[N], ABC):
-    def average(self) -> "NumericChromosome[N]":
-        raise NotImplementedError
+    __slots__ = ()
+
+    def average(self) -> float:
+        """
+        Average value of the genes, computed with a numpy reduction over the gene array.
+
+        :return: mean of the genes
+        """
+        if len(self._genes) == 0:
+            raise ValueError("Chromosome is empty, cannot calculate average.")
+
+        return float(self._genes.mean())
 
 
 class IntegerChromosome(NumericChromosome):
-    def __init__(self, size=None, min_range=None, max_range=None):
+    __slots__ = ()
+
+    def __init__(self, size=None, min_range=None, max_range=None, dtype=None, size_hint=None):
+        """
+        :param size: number of random genes, or None for an empty chromosome
+        :param min_range: minimum value of the random genes
+        :param max_range: maximum value of the random genes, inclusive
+        :param dtype: numpy integer dtype of the genes. By default the genes are stored as int32 when the range fits
+            in 32 bits, halving the memory of the chromosome, and as int64 otherwise
+        :param size_hint: number of genes that will be added to an empty chromosome with add_gene, to allocate
+            their memory up front
+        """
         super().__init__()
 
+        if dtype is None:
+            dtype = np.int32 if min_range is not None and max_range is not None \
+                and _INT32_INFO.min <= min_range and max_range <= _INT32_INFO.max else np.int64
+
+        # the genes are stored in a numpy integer array, generated in a single call
         if size is not None and min_range is not None and max_range is not None:
-            self._genes = [random.randint(min_range, max_range) for _ in range(size)]
+            self._genes = get_rng().integers(min_range, max_range, size=size, dtype=dtype, endpoint=True)
         elif size is not None:
-            self._genes = [random.randint(-2 ** 31, 2 ** 31 - 1) for _ in range(size)]
+            self._genes = get_rng().integers(-2 ** 31, 2 ** 31 - 1, size=size, dtype=dtype, endpoint=True)
+        elif size_hint:
+            self._reserve(size_hint, dtype)
         else:
-            self._genes = []
+            self._genes = np.empty(0, dtype=dtype)
 
     @property
     def genes(self):
@@ -128,49 +255,58 @@ class IntegerChromosome(NumericChromosome):
 
     @genes.setter
     def genes(self, genes: List[N]):
-        self._genes = genes
+        # signed integer arrays keep their dtype, so int32 genes are not widened
+        dtype = genes.dtype if isinstance(genes, np.ndarray) and genes.dtype.kind == "i" else np.int64
+        self._genes = _validate_bulk(genes, dtype, "iu", "alleles must be of type int")
+        self._alleles = None
 
     def add_gene(self, gene: N):
-        if gene is not None and not isinstance(gene, int):
+        if gene is not None and not isinstance(gene, (int, np.integer)):
             raise ValueError("allele must be of type int1")
-        self._genes.append(gene)
+        self._append(gene)
+
+    def extend_genes(self, values):
+        """
+        Append several genes at once, faster than calling add_gene for each of them.
+
+        :param values: iterable of int values
+        """
+        self._extend(values, np.int64, "iu", "alleles must be of type int")
 
     def set_gene(self, index: int, gene: N):
-        if gene is not None and not isinstance(gene, int):
+        if gene is not None and not isinstance(gene, (int, np.integer)):
             raise ValueError("allele must be of type int2")
         self._genes[index] = gene
+        self._alleles = None
 
     def insert_gene(self, index: int, gene: N):
-        if gene is not None and not isinstance(gene, int):
+        if gene is not None and not isinstance(gene, (int, np.integer)):
             raise ValueError("allele must be of type int3")
-        self._genes.insert(index, gene)
+        self._genes = np.insert(self._genes, index, gene)
+        self._alleles = None
 
     def to_list(self) -> List[int]:
-        return self._genes
+        return self._genes.tolist()
 
     def copy(self) -> 'IntegerChromosome':
-        new_chromosome = IntegerChromosome()
-        # Since the list contains only boolean values, a shallow copy is sufficient
-        new_chromosome._genes = self._genes.copy()
-        return new_chromosome
-
-    def average(self) -> float:
-        if not self._genes:
-            raise ValueError("Chromosome is empty, cannot calculate average.")
-
-        return sum(self._genes) / len(self._genes)
+        return IntegerChromosome._from_genes(self._genes.copy())
 
 
 class FloatChromosome(NumericChromosome[N]):
-    def __init__(self, size=None, min_range=None, max_range=None):
+    __slots__ = ()
+
+    def __init__(self, size=None, min_range=None, max_range=None, size_hint=None):
         super().__init__()
 
+        # the genes are stored in a numpy float64 array, generated in a single call
         if size is not None and min_range is not None and max_range is not None:
-            self._genes = [random.uniform(min_range, max_range) for _ in range(size)]
+            self._genes = get_rng().uniform(min_range, max_range, size=size)
         elif size is not None:
-            self._genes = [random.gauss(0, 1) for _ in range(size)]
+            self._genes = get_rng().standard_normal(size)
+        elif size_hint:
+            self._reserve(size_hint, np.float64)
         else:
-            self._genes = []
+            self._genes = np.empty(0, dtype=np.float64)
 
     @property
     def genes(self):
@@ -178,81 +314,126 @@ class FloatChromosome(NumericChromosome[N]):
 
     @genes.setter
     def genes(self, genes: List[N]):
-        self._genes = genes
+        self._genes = _validate_bulk(genes, np.float64, "fiu", "alleles must be float values")
+        self._alleles = None
 
     def add_gene(self, gene: N):
-        if not isinstance(gene, (float, int)):  # allow int because they can be implicitly converted to float
+        # allow int because they can be implicitly converted to float
+        if not isinstance(gene, (float, int, np.floating, np.integer)):
             raise ValueError("allele must be a float value")
-        self._genes.append(gene)
+        self._append(gene)
+
+    def extend_genes(self, values):
+        """
+        Append several genes at once, faster than calling add_gene for each of them.
+
+        :param values: iterable of float or int values
+        """
+        self._extend(values, np.float64, "fiu", "alleles must be float values")
 
     def set_gene(self, index: int, gene: N):
-        if not isinstance(gene, (float, int)):  # allow int because they can be implicitly converted to float
+        # allow int because they can be implicitly converted to float
+        if not isinstance(gene, (float, int, np.floating, np.integer)):
             raise ValueError("allele must be a float value")
         self._genes[index] = gene
+        self._alleles = None
 
     def insert_gene(self, index: int, gene: FloatGene):
-        if not isinstance(gene, (float, int)):  # allow int because they can be implicitly converted to float
+        # allow int because they can be implicitly converted to float
+        if not isinstance(gene, (float, int, np.floating, np.integer)):
             raise ValueError("allele must be a float value")
-        self._genes.insert(index, gene)
+        self._genes = np.insert(self._genes, index, gene)
+        self._alleles = None
 
     def to_list(self) -> List[float]:
-        return self._genes
+        return self._genes.tolist()
 
     def copy(self) -> 'FloatChromosome':
-        new_chromosome = FloatChromosome()
-        # Since the list contains only boolean values, a shallow copy is sufficient
-        new_chromosome._genes = self._genes.copy()
-        return new_chromosome
-
-    def average(self) -> float:
-        if not self._genes:
-            raise ValueError("Chromosome is empty, cannot calculate average.")
-
-        return sum(self._genes) / len(self._genes)
+        return FloatChromosome._from_genes(self._genes.copy())
 
 
 class PermutationChromosome(IntegerChromosome):
-    def __init__(self, size=None, start=0):
+    __slots__ = ('_allele_set',)
+
+    def __init__(self, size=None, start=0, size_hint=None):
         super().__init__()
 
-        if size is not None and start != 0:
-            self._genes = [i + start for i in range(size)]
-            random.shuffle(self._genes)
-        elif size is not None:
-            self._genes = [i for i in range(size)]
-            random.shuffle(self._genes)
+        # the alleles are start, ..., start + size - 1 in a random order, shuffled in compiled code
+        if size is not None:
+            self._genes = np.arange(start, start + size, dtype=np.int64)
+            get_rng().shuffle(self._genes)
         else:
-            self._genes = []
+            size = 0
+            self._genes = np.empty(0, dtype=np.int64)
+            if size_hint:
+                self._reserve(size_hint, np.int64)
+        # set of the alleles, to check in constant time whether an allele was already added.
+        # It is built from the range directly, without converting the shuffled genes back to python ints
+        self._allele_set = set(range(start, start + size))
+
+    @property
+    def genes(self):
+        return self._genes
+
+    @genes.setter
+    def genes(self, genes: List[N]):
+        self._genes = _validate_bulk(genes, np.int64, "iu", "Alleles must be int values")
+        self._allele_set = set(self._genes.tolist())
+        self._alleles = None
+
+    def contains(self, gene) -> bool:
+        return gene in self._allele_set
 
     def set_gene(self, index: int, gene: N):
-        if not isinstance(gene, int):
+        if not isinstance(gene, (int, np.integer)):
             raise ValueError("Only int allele values can be added to a PermutationChromosome")
         if self.contains(gene):
             raise GaException(
                 "Gene with the same allele value was already added to the chromosome. Values must not be repeated in "
                 "a single chromosome.")
+        self._allele_set.discard(self._genes.item(index))
+        self._allele_set.add(gene)
         self._genes[index] = gene
+        self._alleles = None
 
     def add_gene(self, gene: N):
-        if not isinstance(gene, int):
+        if not isinstance(gene, (int, np.integer)):
             raise ValueError("Allele must be an int value")
         if self.contains(gene):
             raise GaException(
                 "Gene with the same allele value was already added to the chromosome. Values must not be repeated in "
                 "a single chromosome.")
-        self._genes.append(gene)
+        self._allele_set.add(gene)
+        self._append(gene)
+
+    def extend_genes(self, values):
+        values = _validate_bulk(values, np.int64, "iu", "Alleles must be int values")
+        alleles = values.ravel().tolist()
+        allele_set = set(alleles)
+        if len(allele_set) != len(alleles) or not allele_set.isdisjoint(self._allele_set):
+            raise GaException(
+                "Gene with the same allele value was already added to the chromosome. Values must not be repeated in "
+                "a single chromosome.")
+        self._genes = np.concatenate((self._genes, values.ravel()))
+        self._alleles = None
+        self._allele_set |= allele_set
 
     def insert_gene(self, index: int, gene: N):
-        if not isinstance(gene, int):
+        if not isinstance(gene, (int, np.integer)):
             raise ValueError("Allele must be an int value")
         if self.contains(gene):
             raise GaException(
                 "Gene with the same allele value was already added to the chromosome. Values must not be repeated in "
                 "a single chromosome.")
-        self._genes.insert(index, gene)
+        self._allele_set.add(gene)
+        self._genes = np.insert(self._genes, index, gene)
+        self._alleles = None
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._allele_set = set(self._genes.tolist())
 
     def copy(self) -> 'PermutationChromosome':
-        new_chromosome = PermutationChromosome()
-        # Since the list contains only boolean values, a shallow copy is sufficient
-        new_chromosome._genes = self._genes.copy()
+        new_chromosome = PermutationChromosome._from_genes(self._genes.copy())
+        new_chromosome._allele_set = self._allele_set.copy()
         return new_chromosome
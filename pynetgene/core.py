@@ -1,10 +1,21 @@
 from typing import List
 from functools import total_ordering
-import random
+from operator import attrgetter
+import heapq
+
+import numpy as np
+
+from pynetgene.utils import get_rng
 
 
 @total_ordering
 class Individual:
+    # no per-instance __dict__: populations hold many individuals
+    __slots__ = ('_chromosome', '_custom_data', '_fitness_score', '_fitness_valid')
+
+    # incremented whenever the fitness of any individual is set, so cached fitness arrays can detect changes
+    _fitness_epoch = 0
+
     def __init__(self, chromosome=None):
         """
         Create a new instance of Individual.
@@ -14,6 +25,7 @@ class Individual:
         self._chromosome = chromosome
         self.custom_data = None
         self._fitness_score = 0.0
+        self._fitness_valid = False
 
     @property
     def chromosome(self):
@@ -36,6 +48,23 @@ class Individual:
     @fitness.setter
     def fitness(self, fitness):
         self._fitness_score = fitness
+        self._fitness_valid = True
+        Individual._fitness_epoch += 1
+
+    @property
+    def fitness_valid(self):
+        """
+        Check whether the fitness was set after the last change of the chromosome.
+
+        :return: True if the fitness score matches the current chromosome.
+        """
+        return self._fitness_valid
+
+    def invalidate_fitness(self):
+        """
+        Mark the fitness as outdated, e.g. after the chromosome was mutated.
+        """
+        self._fitness_valid = False
 
     @property
     def custom_data(self):
@@ -103,6 +132,10 @@ class Population:
         else:
             self._population = population
         self._generation = 0
+        self._gene_matrix = None
+        self._gene_tensor = None
+        self._fitness_array = None
+        self._fitness_epoch = None
 
     @property
     def generation(self):
@@ -135,7 +168,66 @@ class Population:
             float: The sum of fitness scores for all individuals in the population.
 
         """
-        return sum(individual.fitness for individual in self._population)
+        return self.fitness_array.sum().item()
+
+    @property
+    def gene_matrix(self):
+        """
+        Get the alleles of the whole population as a 2D array, one row per individual.
+
+        The matrix is built lazily and reused until individuals are added, removed or reordered. Chromosomes
+        modified in place after the matrix was built are not reflected in it.
+
+        Returns:
+            numpy.ndarray: Array of shape (population size, chromosome size).
+
+        """
+        if self._gene_matrix is None:
+            self._gene_matrix = np.array([individual.chromosome.alleles for individual in self._population])
+        return self._gene_matrix
+
+    @property
+    def fitness_array(self):
+        """
+        Get the fitness of every individual as a 1D array, in population order.
+
+        The array is reused until individuals are added, removed or reordered, or the fitness of any individual is set.
+
+        Returns:
+            numpy.ndarray: Array of shape (population size,).
+
+        """
+        if self._fitness_array is None or self._fitness_epoch != Individual._fitness_epoch:
+            self._fitness_array = np.fromiter((individual.fitness for individual in self._population),
+                                              dtype=np.float64, count=len(self._population))
+            self._fitness_epoch = Individual._fitness_epoch
+        return self._fitness_array
+
+    def gene_tensor(self, device):
+        """
+        Get the gene matrix of the population as a torch tensor on the given device.
+
+        The tensor is cached next to the gene matrix and copied to the device only once per population state.
+        Requires torch to be installed.
+
+        Args:
+            device (str): Torch device the tensor is stored on, e.g. "cuda:0".
+
+        Returns:
+            torch.Tensor: Tensor of shape (population size, chromosome size).
+
+        """
+        import torch
+
+        if self._gene_tensor is None or self._gene_tensor[0] != device:
+            self._gene_tensor = (device, torch.as_tensor(self.gene_matrix, device=device))
+        return self._gene_tensor[1]
+
+    def _invalidate_cache(self):
+        # drop the arrays derived from the individuals, they are rebuilt on the next access
+        self._gene_matrix = None
+        self._gene_tensor = None
+        self._fitness_array = None
 
     def add_individual(self, individual):
         """
@@ -146,6 +238,7 @@ class Population:
 
         """
         self._population.append(individual)
+        self._invalidate_cache()
 
     def remove_individual(self, individual):
         """
@@ -156,6 +249,7 @@ class Population:
 
         """
         self._population.remove(individual)
+        self._invalidate_cache()
 
     def remove_individual_at(self, index):
         """
@@ -166,6 +260,7 @@ class Population:
 
         """
         del self._population[index]
+        self._invalidate_cache()
 
     def clear(self):
         """
@@ -173,6 +268,7 @@ class Population:
 
         """
         self._population.clear()
+        self._invalidate_cache()
 
     def sort(self):
         """
@@ -180,6 +276,7 @@ class Population:
 
         """
         self._population.sort(reverse=True)
+        self._invalidate_cache()
 
     def get_random_individual(self):
         """
@@ -189,7 +286,7 @@ class Population:
             individual: A randomly selected individual.
 
         """
-        return self._population[random.randint(0, len(self._population) - 1)]
+        return self._population[int(get_rng().integers(len(self._population)))]
 
     def get_individual(self, index):
         """
@@ -209,7 +306,22 @@ class Population:
             individual: The best individual.
 
         """
-        return max(self._population)
+        return self._population[int(self.fitness_array.argmax())]
+
+    def top_k(self, k):
+        """
+        Get the k best (highest fitness) individuals from the population, best first.
+
+        Runs in linear time for small k, so it is preferred over sorting the whole population.
+
+        Args:
+            k (int): Number of individuals to return.
+
+        Returns:
+            list: The k individuals with the highest fitness.
+
+        """
+        return heapq.nlargest(k, self._population, key=attrgetter('fitness'))
 
     def clone(self):
         """
@@ -273,6 +385,16 @@ class Population:
         """
         return len(self._population)
 
+    def __iter__(self):
+        """
+        Iterate over the individuals of the population without copying them.
+
+        Returns:
+            iterator: Iterator over the individuals.
+
+        """
+        return iter(self._population)
+
     def __getitem__(self, index):
         """
         Get an individual from the population using indexing.
@@ -296,6 +418,7 @@ class Population:
 
         """
         self._population[index] = individual
+        self._invalidate_cache()
 
 
 # class Offspring:
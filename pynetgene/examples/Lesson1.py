@@ -8,13 +8,7 @@ import pynetgene.ga
 
 
 def lesson1_fitness(individual):
-    fitness = 0
-    chromosome = individual.chromosome
-    for i in range(len(chromosome)):
-        gene = chromosome.get_gene(i)
-        if gene == True:
-            fitness += 1
-    individual.fitness = fitness
+    individual.fitness = individual.chromosome.bit_count()
 
 def tracker(g: GeneticAlgorithm, r: GenerationResult):
     print("Step: ", r.generation_number)
@@ -1,3 +1,5 @@
+import numpy as np
+
 from pynetgene.chromosome import PermutationChromosome, FloatChromosome
 from pynetgene.core import Population, Individual
 from pynetgene.ga import GeneticConfiguration, GeneticAlgorithm, GenerationResult
@@ -29,21 +31,18 @@ ga = GeneticConfiguration(elitism_size=1,
                           n_threads= 6,
                           ).get_algorithm()
 
+coefficients = np.array([3.4, -7.5, 21, 1.2, -11.3, 2.2, -4.7])
+
 def fitness_function(individual):
-    chromosome = individual.chromosome
-    x1 = chromosome.get_gene(0)
-    x2 = chromosome.get_gene(1)
-    x3 = chromosome.get_gene(2)
-    x4 = chromosome.get_gene(3)
-    x5 = chromosome.get_gene(4)
-    x6 = chromosome.get_gene(5)
-    x7 = chromosome.get_gene(6)
-    result = 3.4 * x1 - 7.5 * x2 + 21 * x3 + 1.2 * x4 - 11.3 * x5 + 2.2 * x6 - 4.7 * x7
+    # read all the alleles at once instead of calling get_gene for each of them
+    alleles = individual.chromosome.alleles
+    result = float(alleles @ coefficients)
     fitness_score = 0
     if result == 21:
-        fitness_score = float("intf")
+        fitness_score = float("inf")
     else:
-        fitness_score = 1 / (result -21 ) ** 2
+        deviation = result - 21
+        fitness_score = 1 / (deviation * deviation)
     individual.fitness = fitness_score
     individual.custom_data = result
 
@@ -1,4 +1,6 @@
+import collections
 import concurrent.futures
+import itertools
 import threading
 import time
 
@@ -7,9 +9,13 @@ from pynetgene.operators.crossover import OnePointCrossover, CrossoverOperator
 from pynetgene.exception import *
 from pynetgene.operators.mutator import *
 from pynetgene.operators.selection import *
-from pynetgene.utils import ConsolePrinter, TaskExecutor
+from pynetgene.utils import ConsolePrinter, TaskExecutor, set_seed
 import logging
-from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+
+# numpy dtype kind of the gene matrix of the chromosomes supported by the gene matrix evolution
+_MATRIX_DTYPE_KINDS = {BitChromosome: 'b', IntegerChromosome: 'i', FloatChromosome: 'f'}
 
 
 class GeneticAlgorithm:
@@ -18,7 +24,8 @@ class GeneticAlgorithm:
                  elitism, elitism_size, max_generation,
                  target_fitness, skip_crossover,
                  skip_mutation, n_threads,
-                 clock, printer):
+                 clock, printer, device="cpu", cache_fitness=False, seed=None, pool_kind="thread",
+                 fitness_cache_size=0, parallel_threshold=0):
         self._parent_selector = parent_selector
         self._crossover_operator = crossover_operator
         self._mutator_operator = mutator_operator
@@ -35,15 +42,29 @@ class GeneticAlgorithm:
         self._clock = verify_is_not_null(clock)
         self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=n_threads)
         self._printer = printer
+        self._device = device
+        self._cache_fitness = cache_fitness
+        self._rng = np.random.default_rng(seed)
+        if seed is not None:
+            # seed the generators of the chromosomes and operators as well
+            set_seed(seed)
+        self._pool_kind = pool_kind
+        self._process_executor = None
+        self._fitness_cache_size = fitness_cache_size
+        # fitness and custom data memoized by chromosome fingerprint, least recently used first
+        self._fitness_cache = collections.OrderedDict() if fitness_cache_size > 0 else None
+        self._parallel_threshold = parallel_threshold
         self.lock = threading.Lock()
 
         self._stop_conditions = []
         self._fitness_function = None
         self._generation_tracker = None
         self._population = None
+        self._best_individual = None
 
         max_generation_stop = lambda population: population.generation == self._max_generation
-        target_fitness_stop = lambda population: self._target_fitness <= population.get_best_individual().fitness
+        # the best individual is found once per generation in _evolve_generation, no need to scan the population again
+        target_fitness_stop = lambda population: self._target_fitness <= self._best_individual.fitness
         self._stop_conditions.append(max_generation_stop)
         self._stop_conditions.append(target_fitness_stop)
 
@@ -109,6 +130,7 @@ class GeneticAlgorithm:
             raise GaException("Mutator operator must be an instance of MutatorOperator")
         else:
             self._mutator_operator = new_mutator_operator
+            self._bind_operators()
 
     @property
     def crossover_operator(self):
@@ -120,11 +142,31 @@ class GeneticAlgorithm:
             raise GaException("Crossover operator must be an instance of CrossoverOperator")
         else:
             self._crossover_operator = new_crossover_operator
-
+            self._bind_operators()
+
+    def _bind_operators(self):
+        # Resolve the operator methods once, so the per-individual hot loop calls them directly
+        # instead of looking them up through the operator attributes for every couple and child
+        self._select_parents = self._parent_selector.select_parents
+        # selectors that can select the parents of all the couples in a single call, None otherwise
+        self._select_parent_indices = getattr(self._parent_selector, 'select_parent_indices', None)
+        self._recombine = self._crossover_operator.recombine
+        self._single_offspring = self._crossover_operator.has_single_offspring()
+        self._mutate_individual = self._mutator_operator.mutate
+        # operators that can work directly on the gene matrix, None if the operator does not support it
+        self._recombine_into = getattr(self._crossover_operator, 'recombine_into', None)
+        self._mutate_inplace = getattr(self._mutator_operator, 'mutate_inplace', None)
 
     def evolve(self, population, fitness_function):
         self._population = population
         self._fitness_function = fitness_function
+        self._bind_operators()
+        self.clear_cache()  # the memoized values belong to the previous fitness function
+        if self._pool_kind == "process" and self._n_threads > 1:
+            self._process_executor = concurrent.futures.ProcessPoolExecutor(max_workers=self._n_threads)
+        if getattr(fitness_function, 'jit', False) and len(population) > 0:
+            # compile before the first generation, so compilation time is not reported as evaluation time
+            fitness_function(population.gene_matrix[:1])
         while True:
             result = self._evolve_generation()
             if self._generation_tracker is not None:
@@ -132,6 +174,9 @@ class GeneticAlgorithm:
             if self._has_reached_stop_condition():
                 break
         self._executor.shutdown()  # shut down the executor - free up the system resources used by executor
+        if self._process_executor is not None:
+            self._process_executor.shutdown()
+            self._process_executor = None
 
         # while not self._has_reached_stop_condition():  # as long as the stop condition is not reached
         #     result = self._evolve_generation()                  # evolve
@@ -140,14 +185,18 @@ class GeneticAlgorithm:
 
 
     def _evolve_generation(self):
-        generation_number = self._population.generation     #generation number will be incremented after population evolves
+        population = self._population
+        elitism = self._elitism
+        elitism_size = self._elitism_size
+        population_size = len(population)
+        generation_number = population.generation     #generation number will be incremented after population evolves
 
-        limit = len(self._population) - self._elitism_size if self._elitism else len(self._population)  #set limit -> take in consideration the elitism_size
+        limit = population_size - elitism_size if elitism else population_size  #set limit -> take in consideration the elitism_size
 
         # Elitism: directly copy the best individuals to the new population
-        if self._elitism:
+        if elitism:
             # Get the elite individuals and create a new Population object
-            elite_individuals = self._population[:self._elitism_size]
+            elite_individuals = population.top_k(elitism_size)
             new_population = Population(elite_individuals)
         else:
             # Create an empty Population object
@@ -155,48 +204,155 @@ class GeneticAlgorithm:
 
         task_runner = TaskExecutor()
 
-        evolution_duration = task_runner.run_task(self._evolution_task, self._executor, limit, new_population)
+        evolution_duration = task_runner.run_task(self._evolution_task, None, limit, new_population)
 
-        evaluation_duration = task_runner.run_task(self._calculate_population_fitness, self._executor)
+        evaluation_duration = task_runner.run_task(self._calculate_population_fitness, None)
 
-        self._population.sort()
+        population = self._population  # the evolution task replaced the population
+        population.generation = generation_number + 1
 
-        self._population.generation = generation_number + 1
+        best_individual = self._best_individual = population.get_best_individual()
 
-        return GenerationResult(evolution_duration, evaluation_duration, self._population.get_best_individual(), self._population.generation)
+        return GenerationResult(evolution_duration, evaluation_duration, best_individual, population.generation)
 
     def _evolution_task(self, limit, new_population):
+        if self._supports_matrix_evolution():
+            try:
+                self._matrix_evolution_task(limit, new_population)
+            except (SelectionException, CrossoverException):
+                logging.exception("Exception occurred during crossover")
+            self._population = new_population
+            return
+
         individual_stream = []
 
         if not self._skip_crossover:
             # Generate individuals with crossover directly without threading
-            for _ in range(limit):
-                if len(individual_stream) >= limit:  # if limit is reached
-                    break
-                couple = self._generate_parents()  #extract two parents from the population
-                offspring = self._crossover(couple)  #create offspring
-                for child in offspring:
-                    if len(individual_stream) < limit:   #if limit is not reached
-                        individual_stream.append(child)
-                    else:
-                        break #break if the limit was reached
+            # draw the crossover decisions of the whole generation at once, every couple yields at least one child
+            crossover_draws = self._rng.random(limit).tolist()
+            generate_parents = self._generate_parents
+            crossover = self._crossover
+            append_child = individual_stream.append
+            produced = 0
+            # the exceptions are handled once around the loop instead of for every couple,
+            # an operator that fails would fail the same way for the next couples, so keep the offspring produced so far
+            try:
+                while produced < limit:
+                    couple = generate_parents()  #extract two parents from the population
+                    offspring = crossover(couple, crossover_draws[produced])  #create offspring
+                    if not offspring:
+                        break  # the operator produced no child, retrying would not either
+                    for child in offspring:
+                        append_child(child)
+                        produced += 1
+                        if produced == limit:
+                            break #break if the limit was reached
+            except (SelectionException, CrossoverException):
+                logging.exception("Exception occurred during crossover")
 
         else:
             # If crossover is skipped, take individuals directly from the current population (up to the limit)
-            individual_stream = list(self._population)[:limit]
+            individual_stream = itertools.islice(self._population, limit)
 
-        if not self._skip_mutation:
-            # Apply mutation to each individual in the stream without threading
-            for individual in individual_stream:
-                self._mutate(individual)
-
-        # Add individuals from the stream to the new population
-        for individual in individual_stream:
-            new_population.add_individual(individual)
+        # Apply mutation to each individual in the stream and add it to the new population in a single pass
+        mutate = None if self._skip_mutation else self._mutate
+        add_individual = new_population.add_individual
+        individual_stream = iter(individual_stream)
+        while True:
+            try:
+                for individual in individual_stream:
+                    if mutate is not None:
+                        mutate(individual)
+                    add_individual(individual)
+                break
+            except MutatorException:
+                # resume the loop after the failed individual, which is added without mutation
+                logging.exception("Exception occurred during mutation")
+                add_individual(individual)
 
         # Update the current population with the new population
         self._population = new_population
 
+    def _supports_matrix_evolution(self):
+        # the gene matrix path is used when both operators work on the gene matrix and all the chromosomes
+        # have the same type and length, otherwise the generation is evolved individual by individual
+        population = self._population
+        if self._skip_crossover or self._recombine_into is None or len(population) == 0:
+            return False
+        chromosome = population[0].chromosome
+        chromosome_type = type(chromosome)
+        if chromosome_type not in _MATRIX_DTYPE_KINDS or len(chromosome) == 0:
+            return False
+        if not self._skip_mutation and (self._mutate_inplace is None or
+                                        getattr(self._mutator_operator, 'chromosome_type', None) is not chromosome_type):
+            return False
+        length = len(chromosome)
+        if not all(type(individual.chromosome) is chromosome_type and len(individual.chromosome) == length
+                   for individual in population):
+            return False
+        return population.gene_matrix.dtype.kind == _MATRIX_DTYPE_KINDS[chromosome_type]
+
+    def _matrix_evolution_task(self, limit, new_population):
+        population = self._population
+        rng = self._rng
+        single_offspring = self._single_offspring
+
+        # select every couple of the generation first, then build all the offspring in a single sweep
+        couples = limit if single_offspring else (limit + 1) // 2
+        if self._select_parent_indices is not None:
+            first_parents, second_parents = self._select_parent_indices(population, couples)
+        else:
+            index_of = {id(individual): i for i, individual in enumerate(population)}
+            first_parents = np.empty(couples, dtype=np.intp)
+            second_parents = np.empty(couples, dtype=np.intp)
+            for i in range(couples):
+                first_parent, second_parent = self._select_parents(population)
+                first_parents[i] = index_of[id(first_parent)]
+                second_parents[i] = index_of[id(second_parent)]
+
+        pop_genes = population.gene_matrix
+        length = pop_genes.shape[1]
+        xover_points = self._crossover_operator.draw_cut_points(couples, length, rng)
+        # a couple which is not recombined is copied unchanged, i.e. the crossover point is the end of the chromosome
+        xover_points = np.where(rng.random(couples) < self._crossover_rate, xover_points, length)
+        if single_offspring:
+            parent_idx_a, parent_idx_b = first_parents, second_parents
+        else:
+            # the second child of a couple takes the head of the second parent and the tail of the first parent
+            parent_idx_a = np.column_stack((first_parents, second_parents)).ravel()[:limit]
+            parent_idx_b = np.column_stack((second_parents, first_parents)).ravel()[:limit]
+            xover_points = np.repeat(xover_points, 2)[:limit]
+
+        mut_mask = None
+        if not self._skip_mutation:
+            mut_mask = rng.random((limit, length)) < self._mutator_operator.mutation_rate
+
+        offspring_genes = self._evolve_matrix(pop_genes, parent_idx_a, parent_idx_b, xover_points, mut_mask)
+
+        chromosome_type = type(population[0].chromosome)
+        # every chromosome stores a view on its row of the offspring matrix, no genes are copied
+        for genes in offspring_genes:
+            chromosome = chromosome_type()
+            chromosome.genes = genes
+            new_population.add_individual(Individual(chromosome))
+
+    def _evolve_matrix(self, pop_genes, parent_idx_a, parent_idx_b, xover_points, mut_mask):
+        """
+        Build the genes of the offspring in a single pass over the gene matrix.
+
+        :param pop_genes: gene matrix of the current population
+        :param parent_idx_a: row of the parent giving the genes before the crossover point, one per child
+        :param parent_idx_b: row of the parent giving the genes from the crossover point on, one per child
+        :param xover_points: crossover point of each child
+        :param mut_mask: boolean matrix of the genes to mutate, None to skip the mutation
+        :return: gene matrix of the offspring
+        """
+        offspring_genes = np.empty((len(parent_idx_a), pop_genes.shape[1]), dtype=pop_genes.dtype)
+        self._recombine_into(offspring_genes, pop_genes[parent_idx_a], pop_genes[parent_idx_b], xover_points)
+        if mut_mask is not None:
+            self._mutate_inplace(offspring_genes, mut_mask, self._rng)
+        return offspring_genes
+
     # def crossover_thread(self, individual_stream, limit):
     #     couple = self._parents_supplier()
     #     if couple:
@@ -209,54 +365,132 @@ class GeneticAlgorithm:
     #                     individual_stream.append(child)
 
     def _generate_parents(self):
-        try:
-             # Attempt to select parents using the parent selector
-            parents = self._parent_selector.select_parents(self._population)
-            # Return the selected parents
-            return parents
-        except Exception as e:
-            # If an exception (SelectionException) occurs during parent selection, log the error
-            logging.exception("Error in parent selection", e)
-            # Return None to indicate that the parent selection failed
-            return None
-
-    def _crossover(self, couple):
+        # Select parents using the parent selector, a SelectionException is handled by the caller
+        return self._select_parents(self._population)
+
+    def _crossover(self, couple, random_value):
         # Unpack the parents from the couple
         first_parent, second_parent = couple
-        # Generate a random value
-        random_value = random.random()
         # Create an empty Offspring object
         offspring = []
         if self._crossover_rate > random_value:
-            try:
-                # Perform crossover using the crossover operator
-                offspring = self._crossover_operator.recombine(first_parent, second_parent)
-            except CrossoverException as e:
-                # Handle exceptions that might occur during crossover
-                logging.exception("Exception occurred crossover", e)
+            # Perform crossover using the crossover operator, a CrossoverException is handled by the caller
+            offspring = self._recombine(first_parent, second_parent)
         else:
             offspring.append(Individual(first_parent.chromosome.copy()))
-            if not self._crossover_operator.has_single_offspring():
+            if not self._single_offspring:
                 offspring.append(Individual(second_parent.chromosome.copy()))
 
         return offspring
 
     def _mutate(self, individual):
-        try:
-            # Applying mutation to the individual using the mutator operator
-            self._mutator_operator.mutate(individual)
-        except MutatorException as e:
-            # Handling exceptions that might occur during mutation
-            logging.exception("Exception occurred during mutation", e)
+        # Applying mutation to the individual using the mutator operator, a MutatorException is handled by the caller
+        self._mutate_individual(individual)
+        individual.invalidate_fitness()
 
     def _calculate_population_fitness(self):
-        # for individual in self._population:
-        #     self._fitness_function(individual)
-        # Using ThreadPoolExecutor to parallelize fitness calculation
-        with ThreadPoolExecutor() as executor:
-            executor.map(self._fitness_function, self._population)
-        # for individual in self._population:
-        #     self._fitness_function(individual)
+        fitness_function = self._fitness_function
+        population = self._population
+        if self._process_executor is not None:
+            # every fitness function can run in the worker processes, the GIL is not shared between them
+            pool = self._process_executor
+        elif getattr(fitness_function, 'nogil', False) and self._n_threads > 1:
+            # the fitness function releases the GIL, so the worker threads can evaluate concurrently
+            pool = self._executor
+        else:
+            # plain python fitness functions are serialized by the GIL, threads would only add overhead
+            pool = None
+        if self._cache_fitness:
+            # only evaluate the individuals created or changed since their last evaluation
+            indices = [i for i, individual in enumerate(population) if not individual.fitness_valid]
+            individuals = [population[i] for i in indices]
+        else:
+            indices = None
+            individuals = population
+        if self._fitness_cache is not None:
+            # individuals with the genes of an already evaluated chromosome take the memoized values
+            indices, duplicates = self._recall_fitness(population, indices)
+            individuals = [population[i] for i in indices]
+        if len(individuals) < self._parallel_threshold:
+            # too few individuals to evaluate, dispatching them to the workers would cost more than evaluating them
+            pool = None
+        if getattr(fitness_function, 'vectorized', False):
+            if self._device != "cpu":
+                # the gene matrix lives on the accelerator, only the fitness vector is copied back
+                gene_tensor = population.gene_tensor(self._device)
+                if indices is not None:
+                    gene_tensor = gene_tensor[indices]
+                fitness_values = fitness_function(gene_tensor).detach().cpu().numpy()
+            else:
+                gene_matrix = population.gene_matrix
+                if indices is not None:
+                    gene_matrix = gene_matrix[indices]
+                if pool is not None:
+                    # evaluate one block of rows per worker
+                    chunks = np.array_split(gene_matrix, self._n_threads)
+                    fitness_values = np.concatenate([np.asarray(values) for values in
+                                                     pool.map(fitness_function, chunks)])
+                else:
+                    fitness_values = np.asarray(fitness_function(gene_matrix))
+            # Scatter the results back to the individuals
+            for individual, fitness in zip(individuals, fitness_values.tolist()):
+                individual.fitness = fitness
+        elif pool is not None:
+            # submit the individuals in chunks, about four per worker, instead of one task per individual
+            individuals = list(individuals)
+            chunk_size = max(1, len(individuals) // (4 * self._n_threads))
+            chunks = [individuals[i:i + chunk_size] for i in range(0, len(individuals), chunk_size)]
+            results = pool.map(_evaluate_individuals, itertools.repeat(fitness_function), chunks)
+            if pool is self._process_executor:
+                # the workers evaluated copies of the individuals, copy back what the fitness function set on them
+                for individual, (fitness, custom_data) in zip(individuals, itertools.chain.from_iterable(results)):
+                    individual.fitness = fitness
+                    individual.custom_data = custom_data
+            else:
+                for _ in results:
+                    pass
+        else:
+            for individual in individuals:
+                fitness_function(individual)
+        if self._fitness_cache is not None:
+            self._memoize_fitness(individuals, duplicates)
+
+    def _recall_fitness(self, population, indices):
+        # Set the memoized values and return the indices of the individuals which still have to be evaluated,
+        # only one per genotype, along with the (individual, evaluated individual) pairs of the repeated genotypes
+        fitness_cache = self._fitness_cache
+        missing = []
+        evaluated_by = {}
+        duplicates = []
+        for i in range(len(population)) if indices is None else indices:
+            individual = population[i]
+            fingerprint = individual.chromosome.fingerprint()
+            values = fitness_cache.get(fingerprint)
+            if values is not None:
+                fitness_cache.move_to_end(fingerprint)
+                individual.fitness, individual.custom_data = values
+            elif fingerprint in evaluated_by:
+                duplicates.append((individual, evaluated_by[fingerprint]))
+            else:
+                evaluated_by[fingerprint] = individual
+                missing.append(i)
+        return missing, duplicates
+
+    def _memoize_fitness(self, individuals, duplicates):
+        fitness_cache = self._fitness_cache
+        for individual in individuals:
+            fitness_cache[individual.chromosome.fingerprint()] = (individual.fitness, individual.custom_data)
+        for individual, evaluated in duplicates:
+            individual.fitness, individual.custom_data = evaluated.fitness, evaluated.custom_data
+        while len(fitness_cache) > self._fitness_cache_size:
+            fitness_cache.popitem(last=False)
+
+    def clear_cache(self):
+        """
+        Forget the memoized fitness values, e.g. when the fitness function depends on a state which changed.
+        """
+        if self._fitness_cache is not None:
+            self._fitness_cache.clear()
 
     def _has_reached_stop_condition(self):
         return any(stop_condition(self._population) for stop_condition in self._stop_conditions)
@@ -277,7 +511,8 @@ class GeneticConfiguration:
                  elitism=True, elitism_size=1, max_generation=float('inf'),
                  target_fitness=float('inf'), skip_crossover=False,
                  skip_mutation=False, n_threads=threading.active_count(),
-                 clock=time.time, printer=None):
+                 clock=time.time, printer=None, device="cpu", cache_fitness=False, seed=None,
+                 pool_kind="thread", fitness_cache_size=0, parallel_threshold=0):
 
         ###################parent selector#################################
         if parent_selector is None:
@@ -333,14 +568,32 @@ class GeneticConfiguration:
             raise GaException("skip_mutation must be a boolean value")
         self._skip_mutation = skip_mutation
         self._clock = verify_is_not_null(clock)
-        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=n_threads)
         self._printer = printer if printer is not None else ConsolePrinter()
+        if not isinstance(device, str) or not (device == "cpu" or device.startswith("cuda")):
+            raise GaException("Device must be either 'cpu' or a 'cuda' device")
+        self._device = device
+        if not isinstance(cache_fitness, bool):
+            raise GaException("cache_fitness must be a boolean value")
+        self._cache_fitness = cache_fitness
+        if seed is not None and (not isinstance(seed, int) or seed < 0):
+            raise GaException("Seed must be a non-negative integer")
+        self._seed = seed
+        if pool_kind not in ("thread", "process"):
+            raise GaException("Pool kind must be either 'thread' or 'process'")
+        self._pool_kind = pool_kind
+        if not isinstance(fitness_cache_size, int) or fitness_cache_size < 0:
+            raise GaException("Fitness cache size must be a non-negative integer")
+        self._fitness_cache_size = fitness_cache_size
+        if not isinstance(parallel_threshold, int) or parallel_threshold < 0:
+            raise GaException("Parallel threshold must be a non-negative integer")
+        self._parallel_threshold = parallel_threshold
 
     def get_algorithm(self):
         ga = GeneticAlgorithm(self._parent_selector, self._crossover_operator, self._mutator_operator,
                               self._crossover_rate, self._mutation_rate, self._elitism, self._elitism_size,
                               self._max_generation, self._target_fitness, self._skip_crossover, self._skip_mutation,
-                              self._n_threads, self._clock, self._printer)
+                              self._n_threads, self._clock, self._printer, self._device, self._cache_fitness,
+                              self._seed, self._pool_kind, self._fitness_cache_size, self._parallel_threshold)
         return ga
 
     # @property
@@ -489,15 +742,6 @@ class GeneticConfiguration:
     # @printer.setter
     # def printer(self, printer):
     #     self._printer = printer
-    #
-    # @property
-    # def executor(self):
-    #     # This is a dummy getter to satisfy the @property decorator
-    #     pass
-    #
-    # @executor.setter
-    # def executor(self, executor):
-    #     self._executor = executor
 
 
 
@@ -554,6 +798,75 @@ class GenerationTracker(ABC):
         """
         pass
 
+def vectorized(fitness_function):
+    """
+    Mark a fitness function as vectorized.
+
+    A vectorized fitness function is called once per generation with the population's gene matrix
+    (one row per individual) and must return a 1-D sequence with the fitness of every individual.
+    When the algorithm is configured with a cuda device, the function receives a torch tensor on that
+    device instead and must return a tensor.
+
+    :param fitness_function: Function taking a 2D numpy array and returning the fitness values.
+    :return: The same function, marked as vectorized.
+    """
+    fitness_function.vectorized = True
+    return fitness_function
+
+def _evaluate_individuals(fitness_function, individuals):
+    # Evaluates a chunk of individuals in a worker. A worker process gets copies of the individuals,
+    # so only the values set by the fitness function are sent back to the parent process
+    for individual in individuals:
+        fitness_function(individual)
+    return [(individual.fitness, individual.custom_data) for individual in individuals]
+
+def nogil(fitness_function):
+    """
+    Mark a fitness function as releasing the GIL.
+
+    Fitness functions spending most of their time in code that releases the GIL (numpy, numba nogil
+    kernels, I/O) are evaluated concurrently on the algorithm's worker threads. Pure python fitness
+    functions should not be marked, since the GIL serializes them anyway.
+
+    :param fitness_function: Fitness function, either per individual or vectorized.
+    :return: The same function, marked as releasing the GIL.
+    """
+    fitness_function.nogil = True
+    return fitness_function
+
+def jit_fitness(fitness_function):
+    """
+    Compile a numeric fitness function with numba.
+
+    The function receives the alleles of a single individual as a 1-D float64 array and must return its
+    fitness as a float. The compiled function is applied to every row of the population's gene matrix in a
+    parallel loop, so it is evaluated as a vectorized fitness function. Requires numba to be installed.
+
+    :param fitness_function: Function taking a 1-D numpy array and returning a float.
+    :return: A vectorized fitness function backed by the compiled kernel.
+    """
+    try:
+        import numba
+    except ImportError:
+        raise ImportError("jit_fitness requires numba to be installed (pip install numba)")
+
+    kernel = numba.njit(cache=True)(fitness_function)
+
+    @numba.njit(parallel=True)
+    def evaluate(genes):
+        fitness_values = np.empty(genes.shape[0])
+        for i in numba.prange(genes.shape[0]):
+            fitness_values[i] = kernel(genes[i])
+        return fitness_values
+
+    def compiled_fitness(genes):
+        return evaluate(np.ascontiguousarray(genes, dtype=np.float64))
+
+    compiled_fitness.vectorized = True
+    compiled_fitness.jit = True
+    compiled_fitness.kernel = kernel
+    return compiled_fitness
+
 def verify_is_not_null(obj):
     if obj is None:
         raise ValueError("Object cannot be None")
@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-import random
 from functools import total_ordering
 
+from pynetgene.utils import get_rng
+
 
 class Gene(ABC):
     """
@@ -39,7 +40,7 @@ class BitGene(Gene):
         if allele is not None:
             self._allele = allele
         else:
-            self._allele = random.choice([True, False])
+            self._allele = bool(get_rng().integers(2))
             # self.allele = allele if allele is not None else random.choice([True, False])
 
     @property
@@ -118,9 +119,9 @@ class IntegerGene(NumericGene):
         if allele is not None:
             self._allele = allele
         elif min_range is not None and max_range is not None:
-            self._allele = random.randint(min_range, max_range - 1)
+            self._allele = int(get_rng().integers(min_range, max_range))
         else:
-            self._allele = random.randint(-2 ** 31, 2 ** 31 - 1)  # assuming 32-bit integers
+            self._allele = int(get_rng().integers(-2 ** 31, 2 ** 31 - 1, endpoint=True))  # assuming 32-bit integers
 
     @property
     def allele(self) -> int:
@@ -198,9 +199,9 @@ class FloatGene(NumericGene):
         elif min_range is not None and max_range is not None:
             if not (isinstance(min_range, (float, int)) and isinstance(max_range, (float, int))):
                 raise ValueError("min_range and max_range must be float values")
-            self._allele = random.uniform(min_range, max_range)
+            self._allele = float(get_rng().uniform(min_range, max_range))
         else:
-            self._allele = random.gauss(0, 1)  # A Gaussian distribution around 0
+            self._allele = float(get_rng().standard_normal())  # A Gaussian distribution around 0
 
     @property
     def allele(self):
@@ -41,14 +41,14 @@ class OnePointCrossover(CrossoverOperator):
         if isinstance(first_offspring, PermutationChromosome) or isinstance(second_offspring, PermutationChromosome):
             raise CrossoverException(
                 "Cannot use One Point Crossover for Permutation Chromosome. Only Permutation Crossover Operators are allowed")
-        if first_offspring.length() != second_offspring.length():
+        if len(first_offspring) != len(second_offspring):
             raise CrossoverException("Cannot recombine chromosomes with different lengths")
 
-        crossover_point = random.randint(0, first_offspring.length() - 1)
+        crossover_point = random.randint(0, len(first_offspring) - 1)
 
-        # Optimized swapping using tuple unpacking
+        # Optimized swapping using tuple unpacking, the first tail is copied because array slices are views
         first_offspring.genes[crossover_point:], second_offspring.genes[crossover_point:] = \
-            second_offspring.genes[crossover_point:], first_offspring.genes[crossover_point:]
+            second_offspring.genes[crossover_point:], first_offspring.genes[crossover_point:].copy()
 
         offspring = [Individual(first_offspring)]
         if not self.single_offspring:
@@ -56,6 +56,37 @@ class OnePointCrossover(CrossoverOperator):
 
         return offspring
 
+    def draw_cut_points(self, count: int, length: int, rng) -> np.ndarray:
+        """
+        Draw the crossover points of several recombinations at once.
+
+        Args:
+            count (int): Number of recombinations.
+            length (int): Length of the recombined chromosomes.
+            rng (numpy.random.Generator): Source of the random crossover points.
+
+        Returns:
+            numpy.ndarray: One crossover point per recombination.
+        """
+        return rng.integers(0, length, size=count)
+
+    @staticmethod
+    def recombine_into(out_row, parent_a_row, parent_b_row, cut):
+        """
+        Write the genes of a child directly into a row of a gene matrix.
+
+        The genes before the cut are taken from the first parent and the rest from the second parent. The rows can
+        also be whole matrices with one cut per row, so a generation is recombined in a single call.
+
+        Args:
+            out_row (numpy.ndarray): Row (or matrix) receiving the genes of the child.
+            parent_a_row (numpy.ndarray): Genes of the first parent.
+            parent_b_row (numpy.ndarray): Genes of the second parent.
+            cut: Crossover point, or one crossover point per row.
+        """
+        np.copyto(out_row, parent_b_row)
+        np.copyto(out_row, parent_a_row, where=np.arange(out_row.shape[-1]) < np.expand_dims(cut, -1))
+
 
 class FixedPointCrossover(CrossoverOperator):
     def __init__(self, fixed_point, single_offspring=False):
@@ -92,14 +123,14 @@ class FixedPointCrossover(CrossoverOperator):
             raise CrossoverException(
                 "Cannot use Fixed Point Crossover for Permutation Chromosome. Only Permutation Crossover Operators "
                 "are allowed")
-        if first_offspring.length() != second_offspring.length():
+        if len(first_offspring) != len(second_offspring):
             raise CrossoverException("Cannot recombine chromosomes with different lengths")
-        if self._fixed_point > first_offspring.length():
+        if self._fixed_point > len(first_offspring):
             raise CrossoverException("Fixed crossover point is greater than the chromosome length")
         if self._fixed_point < 0:
             raise CrossoverException("Fixed crossover point is less than 0")
 
-        for i in range(self._fixed_point, first_offspring.length()):
+        for i in range(self._fixed_point, len(first_offspring)):
             self.swap(first_offspring, second_offspring, i)
 
         offspring = [Individual(first_offspring)]
@@ -108,6 +139,13 @@ class FixedPointCrossover(CrossoverOperator):
 
         return offspring
 
+    def draw_cut_points(self, count: int, length: int, rng) -> np.ndarray:
+        if self._fixed_point > length:
+            raise CrossoverException("Fixed crossover point is greater than the chromosome length")
+        return np.full(count, self._fixed_point)
+
+    recombine_into = OnePointCrossover.recombine_into
+
 
 class HalfPointCrossover(CrossoverOperator):
     """
@@ -149,15 +187,15 @@ class HalfPointCrossover(CrossoverOperator):
                 "are allowed")
 
         # Check if the chromosomes have different lengths
-        if first_offspring.length() != second_offspring.length():
+        if len(first_offspring) != len(second_offspring):
             raise CrossoverException("Cannot recombine chromosomes with different lengths")
 
 
         # Determine the crossover point at the middle of the chromosome
-        crossover_point = first_offspring.length() // 2
+        crossover_point = len(first_offspring) // 2
 
         # Swap the tails of the two parents
-        for i in range(crossover_point, first_offspring.length()):
+        for i in range(crossover_point, len(first_offspring)):
             self.swap(first_offspring, second_offspring, i)
 
         offspring = [Individual(first_offspring)]
@@ -166,6 +204,11 @@ class HalfPointCrossover(CrossoverOperator):
 
         return offspring
 
+    def draw_cut_points(self, count: int, length: int, rng) -> np.ndarray:
+        return np.full(count, length // 2)
+
+    recombine_into = OnePointCrossover.recombine_into
+
 
 class Order1Crossover(CrossoverOperator):
 
@@ -176,7 +219,7 @@ class Order1Crossover(CrossoverOperator):
         if not isinstance(x.chromosome, PermutationChromosome) or not isinstance(y.chromosome, PermutationChromosome):
             raise CrossoverException("Order 1 Crossover can be used only for Permutation Chromosome")
 
-        if x.chromosome.length() != y.chromosome.length():
+        if len(x.chromosome) != len(y.chromosome):
             raise CrossoverException("Cannot recombine chromosomes with different lengths")
 
         offspring = []
@@ -194,22 +237,22 @@ class Order1Crossover(CrossoverOperator):
                                                len(x.chromosome) - 2)  # avoid to set the first crossover point the last index
         second_crossover_point = random.randint(first_crossover_point + 1, len(x.chromosome) - 1)
 
-        offspring = PermutationChromosome()
+        offspring = PermutationChromosome(size_hint=len(first_parent))
 
         for i in range(first_crossover_point, second_crossover_point):
             offspring.add_gene(first_parent.get_gene(i))
 
         #start from the right
-        if second_crossover_point != first_parent.length():
-            for i in range(second_crossover_point, second_parent.length()):
-                if second_parent.get_gene(i) not in offspring:
+        if second_crossover_point != len(first_parent):
+            for i in range(second_crossover_point, len(second_parent)):
+                if not offspring.contains(second_parent.get_gene(i)):
                     offspring.add_gene(second_parent.get_gene(i))
 
         j = 0
 
         for i in range(second_crossover_point):
-            if second_parent.get_gene(i) not in offspring:
-                if offspring.length() < second_parent.length() - first_crossover_point:
+            if not offspring.contains(second_parent.get_gene(i)):
+                if len(offspring) < len(second_parent) - first_crossover_point:
                     offspring.add_gene(second_parent.get_gene(i))
                 else:
                     offspring.insert_gene(j, second_parent.get_gene(i))
@@ -231,10 +274,10 @@ class UniformCrossover(CrossoverOperator):
         if isinstance(first_offspring, PermutationChromosome) or isinstance(second_offspring, PermutationChromosome):
             raise CrossoverException(
                 "Permutation Chromosomes are not allowed")
-        if first_offspring.length() != second_offspring.length():
+        if len(first_offspring) != len(second_offspring):
             raise CrossoverException("Cannot recombine chromosomes with different lengths.")
 
-        for i in range(first_offspring.length()):
+        for i in range(len(first_offspring)):
             if random.random() < self.probability:
                 self.swap(first_offspring, second_offspring, i)
 
@@ -263,14 +306,14 @@ class TwoPointCrossover(CrossoverOperator):
 
         if isinstance(first_offspring, PermutationChromosome) or isinstance(second_offspring, PermutationChromosome):
             raise CrossoverException("Cannot use Two Point Crossover for Permutation Chromosome. Only Permutation Crossover Operators are allowed")
-        if first_offspring.length() != second_offspring.length():
+        if len(first_offspring) != len(second_offspring):
             raise CrossoverException("Cannot recombine chromosomes with different lengths")
-        if first_offspring.length() < 3:
+        if len(first_offspring) < 3:
             raise CrossoverException("Multi point crossover cannot work if chromosome length is lower than 3")
 
         # Generate two crossover points
-        first_crossover_point = random.randint(0, first_offspring.length() - 2)
-        second_crossover_point = random.randint(first_crossover_point + 1, first_offspring.length() - 1)
+        first_crossover_point = random.randint(0, len(first_offspring) - 2)
+        second_crossover_point = random.randint(first_crossover_point + 1, len(first_offspring) - 1)
 
         for i in range(first_crossover_point, second_crossover_point):
             self.swap(first_offspring, second_offspring, i)
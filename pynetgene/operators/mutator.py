@@ -1,8 +1,12 @@
 from pynetgene.exception import MutatorException
 from pynetgene.chromosome import *
+import random
 from random import shuffle
 
+import numpy as np
+
 from pynetgene.ga import Individual
+from pynetgene.utils import get_rng
 
 
 class MutatorOperator(ABC):
@@ -42,13 +46,26 @@ class GaussianMutator(MutatorOperator):
 
         chromosome = individual.chromosome
 
-        for i in range(chromosome.length()):
+        for i in range(len(chromosome)):
             rand = random.random()
             if rand < self._mutation_rate:
                 delta = random.gauss(mu=0, sigma=self._sigma)
                 value = delta + chromosome.get_gene(i)
                 chromosome.set_gene(i, value)
 
+    # chromosome type whose gene matrix can be mutated with mutate_inplace
+    chromosome_type = FloatChromosome
+
+    def mutate_inplace(self, row, mask, rng):
+        """
+        Mutate the genes selected by the mask directly in a row (or matrix) of genes.
+
+        :param row: genes to mutate, modified in place
+        :param mask: boolean array marking the genes to mutate
+        :param rng: numpy random generator
+        """
+        row[mask] += rng.normal(0, self._sigma, np.count_nonzero(mask))
+
 class BitFlipMutator(MutatorOperator):
 
     def mutate(self, individual: Individual):
@@ -56,11 +73,14 @@ class BitFlipMutator(MutatorOperator):
             raise MutatorException("Bit Flip Mutator is applicable only for BitChromosome")
 
         chromosome = individual.chromosome
-        for i in range(chromosome.length()):
-            rand = random.random()
-            if rand < self.mutation_rate:
-                current_gene = chromosome.get_gene(i)  # Assuming this returns a boolean
-                chromosome.set_gene(i, not current_gene)
+        # flip all the selected genes with a single xor over the gene array
+        flips = get_rng().random(len(chromosome)) < self.mutation_rate
+        chromosome.genes = np.logical_xor(chromosome.genes, flips)
+
+    chromosome_type = BitChromosome
+
+    def mutate_inplace(self, row, mask, rng):
+        np.logical_xor(row, mask, out=row)
 
 class IntegerMutator(MutatorOperator):
 
@@ -82,12 +102,17 @@ class IntegerMutator(MutatorOperator):
             raise MutatorException("Integer Mutator is applicable only for int chromosomes")
 
         chromosome = individual.chromosome
-        for i in range(chromosome.length()):
+        for i in range(len(chromosome)):
             rand = random.random()
             if rand < self._mutation_rate:
                 value = random.randint(self._min_range, self._max_range)
                 chromosome.set_gene(i, value)
 
+    chromosome_type = IntegerChromosome
+
+    def mutate_inplace(self, row, mask, rng):
+        row[mask] = rng.integers(self._min_range, self._max_range, size=np.count_nonzero(mask), endpoint=True)
+
 class InversionMutator(MutatorOperator):
 
     def mutate(self, individual: Individual):
@@ -144,19 +169,22 @@ class RandomMutator(GaussianMutator):
             self._mutate_integer_chromosome(chromosome)
 
     def _mutate_integer_chromosome(self, chromosome):
-        for i in range(chromosome.length()):
+        for i in range(len(chromosome)):
             rand = random.random()
             if rand < self.mutation_rate:
                 delta = random.gauss(mu=0, sigma=self._sigma) * 10
                 chromosome.set_gene(i, delta)
 
     def _mutate_float_chromosome(self, chromosome):
-        for i in range(chromosome.length()):
+        for i in range(len(chromosome)):
             rand = random.random()
             if rand < self.mutation_rate:
                 delta = random.gauss(mu=0, sigma=self._sigma)
                 chromosome.set_gene(i, delta)
 
+    def mutate_inplace(self, row, mask, rng):
+        row[mask] = rng.normal(0, self._sigma, np.count_nonzero(mask))
+
 #
 # from pynetgene.ga import Individual
 #
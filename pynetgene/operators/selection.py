@@ -2,7 +2,17 @@ from abc import ABC, abstractmethod
 from pynetgene.exception import SelectionException
 import random
 
+import numpy as np
+
 from pynetgene.ga import Individual
+from pynetgene.utils import get_rng
+
+try:
+    # numba compiled kernels, the numpy implementation is used when numba is not installed
+    from pynetgene._fast import tournament_kernel, roulette_kernel
+except ImportError:
+    tournament_kernel = None
+    roulette_kernel = None
 
 
 class ParentSelector(ABC):
@@ -57,15 +67,74 @@ class TournamentSelector(ParentSelector):
         self._tournament_size = tournament_size
 
     def select(self, population) -> 'Individual':
-        if len(population) == 0:
+        self._check_population_size(len(population))
+        fitness = population.fitness_array
+        contestants = random.sample(range(len(population)), self._tournament_size)
+        return population[max(contestants, key=fitness.__getitem__)]
+
+    def select_parents(self, population) -> tuple:
+        first_parents, second_parents = self.select_parent_indices(population, 1)
+        return population[first_parents[0]], population[second_parents[0]]
+
+    def select_parent_indices(self, population, count):
+        """
+        Select the parents of several couples at once.
+
+        All the tournaments are drawn as a matrix of contestant indices and decided with a single argmax over their
+        fitness, instead of running one tournament at a time.
+
+        :param population: population to select from
+        :param count: number of couples
+        :return: two arrays with the population indices of the first and of the second parent of each couple
+        """
+        size = len(population)
+        self._check_population_size(size)
+        fitness = population.fitness_array
+        first_parents = self._tournament_winners(fitness, self._draw_tournaments(count, size))
+        if self._incest_prevention:
+            # the second tournament is held without the first parent: draw among the other size - 1 individuals
+            # and skip the index of the first parent
+            self._check_population_size(size - 1)
+            contestants = self._draw_tournaments(count, size - 1)
+            contestants += contestants >= first_parents[:, np.newaxis]
+            second_parents = self._tournament_winners(fitness, contestants)
+        else:
+            second_parents = self._tournament_winners(fitness, self._draw_tournaments(count, size))
+        return first_parents, second_parents
+
+    def _check_population_size(self, size):
+        if size == 0:
             raise SelectionException("Population size is 0! Cannot select parents.")
-        if len(population) <= self.tournament_size:
+        if size <= self._tournament_size:
             raise SelectionException("Tournament size cannot be equal or higher than the population size!")
 
-        select_from = population.clone()
-        random.shuffle(select_from)
-        selected = max(select_from[:self.tournament_size], key=lambda x: x.fitness)
-        return selected
+    def _draw_tournaments(self, count, size):
+        # one row of distinct contestant indices per tournament
+        tournament_size = self._tournament_size
+        if tournament_size * tournament_size <= size:
+            # few rows have a repeated contestant: mask them and redraw only those rows, checking again only the
+            # redrawn ones, so the loop stays in numpy and runs about once
+            rng = get_rng()
+            contestants = rng.integers(0, size, size=(count, tournament_size))
+            rows = np.arange(count) if tournament_size > 1 else np.zeros(0, dtype=np.intp)
+            while len(rows):
+                drawn = contestants[rows]
+                if tournament_size == 2:
+                    repeated = drawn[:, 0] == drawn[:, 1]
+                else:
+                    drawn.sort(axis=1)
+                    repeated = (drawn[:, 1:] == drawn[:, :-1]).any(axis=1)
+                rows = rows[repeated]
+                contestants[rows] = rng.integers(0, size, size=(len(rows), tournament_size))
+            return contestants
+        # large tournaments: take the indices of the smallest random keys of each row
+        return get_rng().random((count, size)).argpartition(tournament_size - 1, axis=1)[:, :tournament_size]
+
+    @staticmethod
+    def _tournament_winners(fitness, contestants):
+        if tournament_kernel is not None:
+            return tournament_kernel(fitness, contestants)
+        return contestants[np.arange(len(contestants)), fitness[contestants].argmax(axis=1)]
 
 
 # class RankSelector(ParentSelector):
@@ -84,29 +153,119 @@ class TournamentSelector(ParentSelector):
 
 class RankSelector(ParentSelector):
 
+    def __init__(self):
+        super().__init__()
+        # ranking of the last population, rebuilt only when its fitness array changes
+        self._fitness = None
+        self._ranking = None
+        # cumulative rank weights 1, 1 + 2, 1 + 2 + 3, ..., they depend only on the population size
+        self._cumulative_ranks = np.zeros(0)
+
     def select(self, population) -> 'Individual':
-        # Sort the population based on fitness; higher fitness should have a higher rank
-        sorted_population = sorted(population, key=lambda x: x.fitness)
-        # Calculate cumulative rank probability
-        total_ranks = len(population) * (len(population) + 1) // 2
-        roulette_wheel_position = random.uniform(0, total_ranks)
-        cumulative_rank = 0
-        for i, individual in enumerate(sorted_population):
-            rank = i + 1  # Assign ranks starting from 1 up to n
-            cumulative_rank += rank
-            if cumulative_rank >= roulette_wheel_position:
-                return individual
+        ranking = self._rank(population)
+        return population[int(ranking[self._spin(1, len(ranking))[0]])]
+
+    def select_parents(self, population) -> tuple:
+        first_parents, second_parents = self.select_parent_indices(population, 1)
+        return population[first_parents[0]], population[second_parents[0]]
+
+    def select_parent_indices(self, population, count):
+        """
+        Select the parents of several couples at once.
+
+        :param population: population to select from
+        :param count: number of couples
+        :return: two arrays with the population indices of the first and of the second parent of each couple
+        """
+        ranking = self._rank(population)
+        size = len(ranking)
+        first_positions = self._spin(count, size)
+        if not self._incest_prevention:
+            return ranking[first_positions], ranking[self._spin(count, size)]
+
+        if size == 1:
+            raise SelectionException("Population size is 1! Cannot select two different parents.")
+        # rank the others without the first parent: the individuals ranked above it move down by one position
+        second_positions = self._spin(count, size - 1)
+        second_positions += second_positions >= first_positions
+        return ranking[first_positions], ranking[second_positions]
+
+    def _rank(self, population):
+        fitness = population.fitness_array
+        if len(fitness) == 0:
+            raise SelectionException("Population size is 0! Cannot select parents.")
+        if fitness is not self._fitness:
+            self._fitness = fitness
+            # population indices from the lowest to the highest fitness, the one at position i has rank i + 1
+            self._ranking = np.argsort(fitness, kind='stable')
+        return self._ranking
+
+    def _spin(self, count, size):
+        # positions in the ranking selected by count spins of a wheel where position i has a slice of size i + 1.
+        # The weights of a smaller wheel are a prefix of the larger one, so they are computed once for the largest size
+        if len(self._cumulative_ranks) < size:
+            self._cumulative_ranks = np.cumsum(np.arange(1, size + 1, dtype=np.float64))
+        cumulative_ranks = self._cumulative_ranks[:size]
+        return np.searchsorted(cumulative_ranks, get_rng().uniform(0, cumulative_ranks[-1], count))
 
 
 class RouletteSelector(ParentSelector):
 
+    def __init__(self):
+        super().__init__()
+        # cumulative fitness of the last population, rebuilt only when its fitness array changes
+        self._fitness = None
+        self._cumulative_fitness = None
+
     def select(self, population) -> 'Individual':
-        spin_wheel = 0.0
-        roulette_wheel_position = random.random() * population.fitness
-        for i in range(len(population)):
-            spin_wheel += population[i].fitness
-            if spin_wheel >= roulette_wheel_position:
-                return population[i]
+        fitness, cumulative_fitness = self._wheel(population)
+        roulette_wheel_position = random.random() * cumulative_fitness[-1]
+        return population[int(np.searchsorted(cumulative_fitness, roulette_wheel_position))]
+
+    def select_parents(self, population) -> tuple:
+        first_parents, second_parents = self.select_parent_indices(population, 1)
+        return population[first_parents[0]], population[second_parents[0]]
+
+    def select_parent_indices(self, population, count):
+        """
+        Select the parents of several couples at once.
+
+        Every spin is located on the cumulative fitness with a binary search, all the spins in a single call.
+
+        :param population: population to select from
+        :param count: number of couples
+        :return: two arrays with the population indices of the first and of the second parent of each couple
+        """
+        fitness, cumulative_fitness = self._wheel(population)
+        size = len(fitness)
+        total_fitness = cumulative_fitness[-1]
+        first_parents = np.searchsorted(cumulative_fitness, get_rng().random(count) * total_fitness)
+        if not self._incest_prevention:
+            second_parents = np.searchsorted(cumulative_fitness, get_rng().random(count) * total_fitness)
+            return first_parents, second_parents
+
+        if size == 1:
+            raise SelectionException("Population size is 1! Cannot select two different parents.")
+        if roulette_kernel is not None:
+            return first_parents, roulette_kernel(fitness, cumulative_fitness, first_parents, get_rng().random(count))
+        # spin a wheel without the first parent: the positions past its slice are moved after it
+        first_fitness = fitness[first_parents]
+        slice_start = cumulative_fitness[first_parents] - first_fitness
+        positions = get_rng().random(count) * (total_fitness - first_fitness)
+        positions = np.where(positions > slice_start, positions + first_fitness, positions)
+        second_parents = np.minimum(np.searchsorted(cumulative_fitness, positions), size - 1)
+        # a wheel without any weight left, e.g. when all the fitness values are 0, can still point to the first parent
+        second_parents = np.where(second_parents == first_parents, (first_parents + 1) % size, second_parents)
+        return first_parents, second_parents
+
+    def _wheel(self, population):
+        fitness = population.fitness_array
+        if len(fitness) == 0:
+            raise SelectionException("Population size is 0! Cannot select parents.")
+        if fitness is not self._fitness:
+            self._fitness = fitness
+            self._cumulative_fitness = np.cumsum(fitness)
+        return fitness, self._cumulative_fitness
 
 class CompetitionSelector(ParentSelector):
 
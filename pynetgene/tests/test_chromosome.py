@@ -0,0 +1,170 @@
+import concurrent.futures
+
+import numpy as np
+import pytest
+
+from pynetgene.chromosome import BitChromosome, IntegerChromosome, FloatChromosome, PermutationChromosome
+from pynetgene.exception import GaException
+from pynetgene.utils import get_rng, set_seed
+
+
+def test_alleles_match_genes():
+    chromosome = FloatChromosome(10)
+    assert chromosome.alleles.tolist() == chromosome.to_list()
+
+def test_alleles_are_cached():
+    chromosome = IntegerChromosome(10, 0, 9)
+    assert chromosome.alleles is chromosome.alleles
+
+def test_alleles_invalidated_on_change():
+    chromosome = IntegerChromosome()
+    for i in range(5):
+        chromosome.add_gene(i)
+    assert chromosome.alleles.tolist() == [0, 1, 2, 3, 4]
+    chromosome.set_gene(0, 10)
+    assert chromosome.alleles.tolist() == [10, 1, 2, 3, 4]
+    chromosome.insert_gene(0, 7)
+    assert chromosome.alleles.tolist() == [7, 10, 1, 2, 3, 4]
+    chromosome[1] = 8
+    assert chromosome.alleles.tolist() == [7, 8, 1, 2, 3, 4]
+
+def test_alleles_not_shared_by_copy():
+    chromosome = BitChromosome(10)
+    alleles = chromosome.alleles
+    copy = chromosome.copy()
+    copy.set_gene(0, not copy.get_gene(0))
+    assert chromosome.alleles is alleles
+    assert copy.alleles[0] != alleles[0]
+
+def test_bit_count():
+    chromosome = BitChromosome()
+    for gene in [True, False, True, True, False]:
+        chromosome.add_gene(gene)
+    assert chromosome.bit_count() == 3
+
+def test_bit_count_random_chromosome():
+    chromosome = BitChromosome(50)
+    assert chromosome.bit_count() == sum(1 for gene in chromosome if gene)
+
+def test_bit_chromosome_returns_python_bools():
+    chromosome = BitChromosome(10)
+    assert len(chromosome) == 10
+    assert all(type(gene) is bool for gene in chromosome.to_list())
+    assert type(chromosome.get_gene(0)) is bool
+
+def test_bit_chromosome_insert_gene():
+    chromosome = BitChromosome()
+    chromosome.add_gene(True)
+    chromosome.add_gene(True)
+    chromosome.insert_gene(1, False)
+    assert chromosome.to_list() == [True, False, True]
+    with pytest.raises(ValueError):
+        chromosome.insert_gene(0, 1)
+
+def test_bit_chromosome_copy_is_independent():
+    chromosome = BitChromosome(10)
+    copy = chromosome.copy()
+    copy.set_gene(0, not copy.get_gene(0))
+    assert copy.get_gene(0) != chromosome.get_gene(0)
+
+def test_permutation_contains():
+    chromosome = PermutationChromosome(5)
+    assert all(chromosome.contains(i) for i in range(5))
+    assert not chromosome.contains(5)
+
+def test_permutation_set_gene_replaces_allele():
+    chromosome = PermutationChromosome()
+    for i in range(3):
+        chromosome.add_gene(i)
+    chromosome.set_gene(0, 7)
+    assert chromosome.contains(7)
+    assert not chromosome.contains(0)
+    chromosome.add_gene(0)
+    assert chromosome.to_list() == [7, 1, 2, 0]
+
+def test_permutation_copy_has_own_alleles():
+    chromosome = PermutationChromosome(3)
+    copy = chromosome.copy()
+    copy.add_gene(3)
+    assert copy.contains(3)
+    assert not chromosome.contains(3)
+
+def test_average():
+    chromosome = IntegerChromosome()
+    for gene in [1, 2, 3, 6]:
+        chromosome.add_gene(gene)
+    assert chromosome.average() == 3.0
+    assert FloatChromosome(20, 1.0, 1.0).average() == pytest.approx(1.0)
+    with pytest.raises(ValueError):
+        FloatChromosome().average()
+
+def test_extend_genes():
+    chromosome = FloatChromosome()
+    chromosome.add_gene(0.5)
+    chromosome.extend_genes([1, 2.5])
+    assert chromosome.to_list() == [0.5, 1.0, 2.5]
+    with pytest.raises(ValueError):
+        IntegerChromosome().extend_genes([1.5, 2.0])
+    with pytest.raises(ValueError):
+        BitChromosome().extend_genes([1, 2])
+
+def test_genes_setter_validates_alleles():
+    chromosome = BitChromosome()
+    chromosome.genes = [1, 0, 1]
+    assert chromosome.to_list() == [True, False, True]
+    chromosome = FloatChromosome()
+    chromosome.genes = [1, 2]
+    assert chromosome.to_list() == [1.0, 2.0]
+    with pytest.raises(ValueError):
+        IntegerChromosome().genes = [0.5, 1.5]
+    with pytest.raises(ValueError):
+        PermutationChromosome().genes = ["a", "b"]
+
+def test_permutation_extend_genes_rejects_repeated_alleles():
+    chromosome = PermutationChromosome()
+    chromosome.extend_genes([2, 0])
+    chromosome.extend_genes([1])
+    assert chromosome.to_list() == [2, 0, 1]
+    with pytest.raises(GaException):
+        chromosome.extend_genes([3, 3])
+    with pytest.raises(GaException):
+        chromosome.extend_genes([0])
+
+def test_set_seed_reproduces_chromosomes():
+    set_seed(42)
+    first = IntegerChromosome(20, 0, 9).to_list()
+    set_seed(42)
+    assert IntegerChromosome(20, 0, 9).to_list() == first
+    set_seed()
+
+def test_threads_have_own_generator():
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(get_rng).result() is not get_rng()
+
+def test_integer_chromosome_dtype():
+    assert IntegerChromosome(10, 0, 9).genes.dtype == np.int32
+    assert IntegerChromosome(10, 0, 2 ** 40).genes.dtype == np.int64
+    assert IntegerChromosome(10, 0, 9, dtype=np.int64).genes.dtype == np.int64
+
+def test_add_gene_grows_chromosome():
+    chromosome = IntegerChromosome()
+    for i in range(100):
+        chromosome.add_gene(i)
+    copy = chromosome.copy()
+    copy.add_gene(-1)
+    chromosome.add_gene(100)
+    assert chromosome.to_list() == list(range(101))
+    assert copy.to_list() == list(range(100)) + [-1]
+
+def test_permutation_chromosome_with_start():
+    chromosome = PermutationChromosome(10, 5)
+    assert sorted(chromosome.to_list()) == list(range(5, 15))
+    assert chromosome.contains(5) and chromosome.contains(14)
+    assert not chromosome.contains(15)
+
+def test_size_hint_preallocates_genes():
+    chromosome = FloatChromosome(size_hint=3)
+    assert len(chromosome) == 0
+    for gene in (0.5, 1.5, 2.5, 3.5):
+        chromosome.add_gene(gene)
+    assert chromosome.to_list() == [0.5, 1.5, 2.5, 3.5]
@@ -165,3 +165,37 @@ def test_invalid_mutator_operator_type():
     assert "Mutator operator must be an instance of MutatorOperator" in str(exc_info.value), "Should raise GaException for non-MutatorOperator types"
 
 
+
+def test_default_device():
+    config = GeneticConfiguration()
+    assert config._device == "cpu", "Default device should be the cpu"
+
+def test_invalid_device():
+    with pytest.raises(GaException) as exc_info:
+        GeneticConfiguration(device="tpu")
+    assert "Device must be either 'cpu' or a 'cuda' device" in str(exc_info.value)
+
+def test_invalid_cache_fitness():
+    with pytest.raises(GaException) as exc_info:
+        GeneticConfiguration(cache_fitness="yes")
+    assert "cache_fitness must be a boolean value" in str(exc_info.value)
+
+def test_invalid_seed():
+    with pytest.raises(GaException) as exc_info:
+        GeneticConfiguration(seed=-1)
+    assert "Seed must be a non-negative integer" in str(exc_info.value)
+
+def test_invalid_pool_kind():
+    with pytest.raises(GaException) as exc_info:
+        GeneticConfiguration(pool_kind="fiber")
+    assert "Pool kind must be either 'thread' or 'process'" in str(exc_info.value)
+
+def test_invalid_fitness_cache_size():
+    with pytest.raises(GaException) as exc_info:
+        GeneticConfiguration(fitness_cache_size=-1)
+    assert "Fitness cache size must be a non-negative integer" in str(exc_info.value)
+
+def test_invalid_parallel_threshold():
+    with pytest.raises(GaException) as exc_info:
+        GeneticConfiguration(parallel_threshold=-5)
+    assert "Parallel threshold must be a non-negative integer" in str(exc_info.value)
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from pynetgene.core import Individual
 from pynetgene.chromosome import Chromosome, PermutationChromosome
@@ -212,3 +213,29 @@ def test_two_point_crossover_exception():
 if __name__ == "__main__":
     pytest.main()
 
+def test_one_point_crossover_bit_chromosome():
+    chromosome_x = BitChromosome()
+    chromosome_y = BitChromosome()
+    for i in range(10):
+        chromosome_x.add_gene(True)
+        chromosome_y.add_gene(False)
+    offspring = OnePointCrossover().recombine(Individual(chromosome_x), Individual(chromosome_y))
+    genes_ch1 = offspring[0].chromosome.to_list()
+    genes_ch2 = offspring[1].chromosome.to_list()
+    # every gene comes from exactly one of the parents
+    assert [not gene for gene in genes_ch1] == genes_ch2
+    assert chromosome_x.to_list() == [True] * 10
+
+def test_one_point_crossover_recombine_into():
+    parent_a = np.array([[1, 2, 3, 4], [1, 2, 3, 4]])
+    parent_b = np.array([[5, 6, 7, 8], [5, 6, 7, 8]])
+    out = np.empty_like(parent_a)
+    OnePointCrossover.recombine_into(out, parent_a, parent_b, np.array([1, 4]))
+    assert out.tolist() == [[1, 6, 7, 8], [1, 2, 3, 4]]
+
+def test_fixed_point_crossover_cut_points():
+    op_crossover = FixedPointCrossover(2)
+    assert op_crossover.draw_cut_points(3, 5, np.random.default_rng()).tolist() == [2, 2, 2]
+    with pytest.raises(CrossoverException):
+        op_crossover.draw_cut_points(3, 1, np.random.default_rng())
+
@@ -3,7 +3,7 @@ import pytest
 from pynetgene.chromosome import BitChromosome, PermutationChromosome, IntegerChromosome, FloatChromosome
 from pynetgene.core import Population, Individual
 from pynetgene.operators.crossover import OnePointCrossover, Order1Crossover, TwoPointCrossover
-from pynetgene.ga import GeneticAlgorithm, GenerationResult, GeneticConfiguration
+from pynetgene.ga import GeneticAlgorithm, GenerationResult, GeneticConfiguration, vectorized, jit_fitness, nogil
 from pynetgene.operators.selection import RouletteSelector, TournamentSelector, RankSelector, CompetitionSelector
 from pynetgene.operators.mutator import GaussianMutator, BitFlipMutator, InversionMutator, IntegerMutator
 import time
@@ -100,6 +100,86 @@ def test_stop_condition_target_fitness(setup_genetic_algorithm):
     # Assert that only one generation was evolved
     assert ga.population.generation == 3, f"Expected generation 1, got {ga.population.generation}"
 
+def test_failed_mutation_keeps_population_size():
+    # BitFlipMutator cannot mutate float chromosomes, the offspring are kept without mutation
+    ga = GeneticConfiguration(mutator_operator=BitFlipMutator(),
+                              elitism_size=1,
+                              max_generation=2,
+                              ).get_algorithm()
+
+    population = Population()
+    for i in range(10):
+        population.add_individual(Individual(FloatChromosome(3, 0, 1)))
+
+    ga.evolve(population, lambda individual: setattr(individual, 'fitness', sum(individual.chromosome)))
+
+    assert ga.population.generation == 2
+    assert len(ga.population) == 10
+
+def test_cache_fitness_skips_unchanged_individuals():
+    ga = GeneticConfiguration(elitism_size=1,
+                              max_generation=5,
+                              skip_crossover=True,
+                              skip_mutation=True,
+                              cache_fitness=True,
+                              ).get_algorithm()
+
+    population = Population()
+    for i in range(10):
+        population.add_individual(Individual(IntegerChromosome(3, 1, 10)))
+
+    evaluated = []
+    def counting_fitness(individual):
+        evaluated.append(individual)
+        fitness_integer(individual)
+
+    ga.evolve(population, counting_fitness)
+
+    assert ga.population.generation == 5
+    assert len(evaluated) == 10, f"Expected each individual to be evaluated once, got {len(evaluated)} evaluations"
+
+def test_fitness_cache_evaluates_each_genotype_once():
+    ga = GeneticConfiguration(elitism_size=1,
+                              max_generation=5,
+                              skip_crossover=True,
+                              skip_mutation=True,
+                              fitness_cache_size=100,
+                              ).get_algorithm()
+
+    population = Population()
+    for i in range(10):
+        population.add_individual(Individual(IntegerChromosome(3, 1, 2)))
+
+    evaluated = []
+    def counting_fitness(individual):
+        evaluated.append(individual)
+        fitness_integer(individual)
+
+    ga.evolve(population, counting_fitness)
+
+    genotypes = {tuple(individual.chromosome.to_list()) for individual in evaluated}
+    assert ga.population.generation == 5
+    assert len(evaluated) == len(genotypes), "Expected each genotype to be evaluated once"
+    for individual in ga.population:
+        assert individual.fitness == individual.chromosome.to_list().count(1)
+
+def test_cache_fitness_reevaluates_mutated_individuals():
+    ga = GeneticConfiguration(mutator_operator=IntegerMutator(1,10),
+                              elitism_size=1,
+                              max_generation=5,
+                              cache_fitness=True,
+                              ).get_algorithm()
+
+    population = Population()
+    for i in range(10):
+        population.add_individual(Individual(IntegerChromosome(3, 1, 10)))
+
+    ga.evolve(population, fitness_integer)
+
+    for individual in ga.population:
+        assert individual.fitness_valid
+        assert individual.fitness == individual.chromosome.to_list().count(1)
+
 def fitness_integer(individual):
     chromosome = individual.chromosome
     fitness_score = 0
@@ -226,6 +306,156 @@ def test_ga_integer_funct5():
     bestFitness = ga.population.get_best_individual().fitness
     assert bestFitness == 3, f"Expected evolution and fitness score to be 3, got {ga.population.generation}"
 
+@vectorized
+def fitness_integer_vectorized(genes):
+    return (genes == 1).sum(axis=1)
+
+def test_ga_integer_vectorized_fitness():
+    mutator = IntegerMutator(1,10)
+    ga = GeneticConfiguration(mutator_operator=mutator,
+                              elitism_size=1,
+                              max_generation=5,
+                              ).get_algorithm()
+
+    population = Population()
+    populationSize = 10
+    chromosomeSize = 3
+
+    for i in range(populationSize):
+        chromosome = IntegerChromosome(chromosomeSize, 1, 10)
+        individual = Individual(chromosome)
+        population.add_individual(individual)
+
+    ga.evolve(population, fitness_integer_vectorized)
+
+    assert ga.population.generation == 5, f"Expected 5 generations, got {ga.population.generation}"
+    for individual in ga.population:
+        assert individual.fitness == individual.chromosome.to_list().count(1)
+
+@pytest.mark.parametrize("fitness_function", [nogil(vectorized(lambda genes: (genes == 1).sum(axis=1))),
+                                              nogil(lambda individual: fitness_integer(individual))])
+def test_ga_integer_nogil_fitness(fitness_function):
+    mutator = IntegerMutator(1,10)
+    ga = GeneticConfiguration(mutator_operator=mutator,
+                              elitism_size=1,
+                              max_generation=5,
+                              n_threads=4,
+                              ).get_algorithm()
+
+    population = Population()
+    populationSize = 10
+    chromosomeSize = 3
+
+    for i in range(populationSize):
+        chromosome = IntegerChromosome(chromosomeSize, 1, 10)
+        individual = Individual(chromosome)
+        population.add_individual(individual)
+
+    ga.evolve(population, fitness_function)
+
+    assert ga.population.generation == 5, f"Expected 5 generations, got {ga.population.generation}"
+    for individual in ga.population:
+        assert individual.fitness == individual.chromosome.to_list().count(1)
+
+@pytest.mark.parametrize("fitness_function", [fitness_integer, fitness_integer_vectorized])
+def test_ga_integer_process_pool_fitness(fitness_function):
+    mutator = IntegerMutator(1,10)
+    ga = GeneticConfiguration(mutator_operator=mutator,
+                              elitism_size=1,
+                              max_generation=3,
+                              n_threads=2,
+                              pool_kind="process",
+                              ).get_algorithm()
+
+    population = Population()
+    populationSize = 10
+    chromosomeSize = 3
+
+    for i in range(populationSize):
+        chromosome = IntegerChromosome(chromosomeSize, 1, 10)
+        individual = Individual(chromosome)
+        population.add_individual(individual)
+
+    ga.evolve(population, fitness_function)
+
+    assert ga.population.generation == 3, f"Expected 3 generations, got {ga.population.generation}"
+    for individual in ga.population:
+        assert individual.fitness == individual.chromosome.to_list().count(1)
+
+def test_parallel_threshold_evaluates_small_populations_serially():
+    # a lambda cannot be sent to a worker process, it works only if the pool is bypassed
+    ga = GeneticConfiguration(mutator_operator=IntegerMutator(1,10),
+                              elitism_size=1,
+                              max_generation=3,
+                              n_threads=2,
+                              pool_kind="process",
+                              parallel_threshold=100,
+                              ).get_algorithm()
+
+    population = Population()
+    for i in range(10):
+        population.add_individual(Individual(IntegerChromosome(3, 1, 10)))
+
+    ga.evolve(population, lambda individual: fitness_integer(individual))
+
+    for individual in ga.population:
+        assert individual.fitness == individual.chromosome.to_list().count(1)
+
+def test_ga_integer_cuda_fitness():
+    torch = pytest.importorskip("torch")
+    if not torch.cuda.is_available():
+        pytest.skip("cuda is not available")
+    mutator = IntegerMutator(1,10)
+    ga = GeneticConfiguration(mutator_operator=mutator,
+                              elitism_size=1,
+                              max_generation=5,
+                              device="cuda",
+                              ).get_algorithm()
+
+    population = Population()
+    populationSize = 10
+    chromosomeSize = 3
+
+    for i in range(populationSize):
+        chromosome = IntegerChromosome(chromosomeSize, 1, 10)
+        individual = Individual(chromosome)
+        population.add_individual(individual)
+
+    ga.evolve(population, vectorized(lambda genes: (genes == 1).sum(dim=1)))
+
+    for individual in ga.population:
+        assert individual.fitness == individual.chromosome.to_list().count(1)
+
+def fitness_integer_kernel(genes):
+    fitness_score = 0.0
+    for i in range(genes.shape[0]):
+        if genes[i] == 1:
+            fitness_score += 1
+    return fitness_score
+
+def test_ga_integer_jit_fitness():
+    pytest.importorskip("numba")
+    mutator = IntegerMutator(1,10)
+    ga = GeneticConfiguration(mutator_operator=mutator,
+                              elitism_size=1,
+                              max_generation=5,
+                              ).get_algorithm()
+
+    population = Population()
+    populationSize = 10
+    chromosomeSize = 3
+
+    for i in range(populationSize):
+        chromosome = IntegerChromosome(chromosomeSize, 1, 10)
+        individual = Individual(chromosome)
+        population.add_individual(individual)
+
+    ga.evolve(population, jit_fitness(fitness_integer_kernel))
+
+    assert ga.population.generation == 5, f"Expected 5 generations, got {ga.population.generation}"
+    for individual in ga.population:
+        assert individual.fitness == individual.chromosome.to_list().count(1)
+
 ################################Lesson 1###############################################
 def lesson1_fitness(individual):
     fitness = 0
@@ -336,9 +566,10 @@ def fitness_function_lesson4(individual):
     result = 3.4 * x1 - 7.5 * x2 + 21 * x3 + 1.2 * x4 - 11.3 * x5 + 2.2 * x6 - 4.7 * x7
     fitness_score = 0
     if result == 21:
-        fitness_score = float("intf")
+        fitness_score = float("inf")
     else:
-        fitness_score = 1 / (result -21 ) ** 2
+        deviation = result - 21
+        fitness_score = 1 / (deviation * deviation)
     individual.fitness = fitness_score
     individual.custom_data = result
 
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from pynetgene.ga import Individual
 from pynetgene.exception import MutatorException
@@ -124,6 +125,18 @@ def test_random_mutator_fnct1(float_individual):
     mutated_genes = float_individual.chromosome.genes
     assert any(og != mg for og, mg in zip(original_genes, mutated_genes)), "Mutation did not occur"
 
+def test_bit_flip_mutator_inplace():
+    genes = np.array([[True, False, True], [False, False, True]])
+    mask = np.array([[True, True, False], [False, False, False]])
+    BitFlipMutator().mutate_inplace(genes, mask, np.random.default_rng())
+    assert genes.tolist() == [[False, True, True], [False, False, True]]
+
+def test_integer_mutator_inplace():
+    genes = np.zeros((4, 5), dtype=np.int64)
+    mask = np.ones((4, 5), dtype=bool)
+    IntegerMutator(1, 3).mutate_inplace(genes, mask, np.random.default_rng())
+    assert genes.min() >= 1 and genes.max() <= 3
+
 # This line allows the tests to be run via the command line
 if __name__ == "__main__":
     pytest.main()
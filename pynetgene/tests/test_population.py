@@ -0,0 +1,46 @@
+import pytest
+
+from pynetgene.core import Population, Individual
+
+
+def create_population_with_fitness(fitness_values):
+    population = Population()
+    for fitness in fitness_values:
+        ind = Individual()
+        ind.fitness = fitness
+        population.add_individual(ind)
+    return population
+
+def test_get_best_individual():
+    population = create_population_with_fitness([3, 1, 5, 2, 4])
+    assert population.get_best_individual().fitness == 5
+
+def test_top_k():
+    population = create_population_with_fitness([3, 1, 5, 2, 4])
+    assert [ind.fitness for ind in population.top_k(3)] == [5, 4, 3]
+
+def test_top_k_does_not_reorder_population():
+    population = create_population_with_fitness([3, 1, 5, 2, 4])
+    population.top_k(2)
+    assert [ind.fitness for ind in population] == [3, 1, 5, 2, 4]
+
+def test_top_k_larger_than_population():
+    population = create_population_with_fitness([3, 1])
+    assert [ind.fitness for ind in population.top_k(5)] == [3, 1]
+
+def test_fitness_array():
+    population = create_population_with_fitness([3, 1, 5])
+    assert population.fitness_array.tolist() == [3.0, 1.0, 5.0]
+    assert population.fitness_array is population.fitness_array
+
+def test_fitness_array_follows_changes():
+    population = create_population_with_fitness([3, 1, 5])
+    population.fitness_array
+    population[0].fitness = 7
+    assert population.fitness_array.tolist() == [7.0, 1.0, 5.0]
+    population.add_individual(Individual())
+    assert population.fitness_array.tolist() == [7.0, 1.0, 5.0, 0.0]
+
+def test_total_fitness():
+    population = create_population_with_fitness([3, 1, 5])
+    assert population.fitness == 9
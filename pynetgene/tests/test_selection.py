@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from pynetgene.core import Population
@@ -56,6 +57,26 @@ def test_tournamet_selector_randomness_in_selection():
     assert len(outcomes) > 1
 
 
+@pytest.mark.parametrize("tournament_size", [2, 3])
+def test_tournament_selector_parent_indices(tournament_size):
+    population = create_population_with_fitness([1, 2, 3, 4, 5])
+    selector = TournamentSelector(tournament_size=tournament_size)
+    first_parents, second_parents = selector.select_parent_indices(population, 200)
+    assert len(first_parents) == len(second_parents) == 200
+    # incest prevention: the parents of a couple are always different individuals
+    assert (first_parents != second_parents).all()
+    # the weakest individuals can never win a tournament of distinct contestants
+    assert set(first_parents.tolist()) <= set(range(tournament_size - 1, 5))
+
+def test_tournament_selector_parent_indices_without_incest_prevention():
+    population = create_population_with_fitness([1, 2, 3])
+    selector = TournamentSelector(tournament_size=2)
+    selector.incest_prevention = False
+    first_parents, second_parents = selector.select_parent_indices(population, 200)
+    assert set(first_parents.tolist()) == {1, 2}
+    assert set(second_parents.tolist()) == {1, 2}
+
+
 ######################RANK_Selector#####################
 
 def test_rank_selection_biased_towards_higher_ranks():
@@ -96,6 +117,15 @@ def test_rank_selection_incest_prevention():
     ind1, ind2 = selector.select_parents(population)
     assert ind1 != ind2, "Incest prevention should avoid selecting the same individual"
 
+def test_rank_selection_parent_indices():
+    population = create_population_with_fitness([5, 1, 4, 2, 3])
+    selector = RankSelector()
+    first_parents, second_parents = selector.select_parent_indices(population, 1000)
+    assert (first_parents != second_parents).all()
+    counts = np.bincount(first_parents, minlength=5)
+    # the best individual has the highest rank, the worst the lowest
+    assert counts[0] > counts[1]
+
 
 #####################Roulette Selection#########################
 
@@ -138,6 +168,26 @@ def test_roulette_selection_incest_prevention():
     ind1, ind2 = selector.select_parents(population)
     assert ind1 != ind2, "Incest prevention should avoid selecting the same individual"
 
+def test_roulette_selection_parent_indices_incest_prevention():
+    population = create_population_with_fitness([1, 2, 3, 4, 5])
+    selector = RouletteSelector()
+    first_parents, second_parents = selector.select_parent_indices(population, 500)
+    assert (first_parents != second_parents).all()
+    assert set(first_parents.tolist()) <= set(range(5))
+    assert set(second_parents.tolist()) <= set(range(5))
+
+def test_roulette_selection_zero_fitness_individual_never_selected():
+    population = create_population_with_fitness([0, 2, 0, 3])
+    selector = RouletteSelector()
+    selector.incest_prevention = False
+    first_parents, second_parents = selector.select_parent_indices(population, 500)
+    assert set(first_parents.tolist()) | set(second_parents.tolist()) <= {1, 3}
+
+def test_roulette_selection_empty_population():
+    selector = RouletteSelector()
+    with pytest.raises(SelectionException):
+        selector.select(create_population_with_fitness([]))
+
 #################################Competition Selector######################
 
 # Test the basic functionality of selecting the higher fitness individual
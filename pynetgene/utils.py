@@ -1,6 +1,44 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
 from concurrent.futures import wait
+import threading
+
+import numpy as np
+
+# every thread draws from its own numpy generator, spawned from a shared seed sequence,
+# so threads never contend on the process-wide lock of the random module
+_thread_local = threading.local()
+_seed_lock = threading.Lock()
+_seed_sequence = np.random.SeedSequence()
+_seed_version = 0
+
+
+def set_seed(seed=None):
+    """
+    Seed the random generators used by the chromosomes and the genetic operators.
+
+    Every thread gets a new generator spawned from the seed, so a single threaded run is reproducible.
+
+    :param seed: non-negative int seed, or None for a random seed
+    """
+    global _seed_sequence, _seed_version
+    with _seed_lock:
+        _seed_sequence = np.random.SeedSequence(seed)
+        _seed_version += 1
+
+
+def get_rng() -> np.random.Generator:
+    """
+    Random generator of the calling thread.
+
+    :return: numpy random generator
+    """
+    if getattr(_thread_local, "version", None) != _seed_version:
+        with _seed_lock:
+            _thread_local.rng = np.random.default_rng(_seed_sequence.spawn(1)[0])
+            _thread_local.version = _seed_version
+    return _thread_local.rng
+
 
 
 class TaskExecutor:
@@ -12,9 +50,13 @@ class TaskExecutor:
         start = datetime.now()
 
         try:
-            future = executor.submit(task, *args, **kwargs)
-            wait([future])  # This should block until the task is done
-            result = future.result()  # Get the result to ensure task completion
+            if executor is None:
+                # run in the calling thread, leaving the executor free for work submitted by the task itself
+                result = task(*args, **kwargs)
+            else:
+                future = executor.submit(task, *args, **kwargs)
+                wait([future])  # This should block until the task is done
+                result = future.result()  # Get the result to ensure task completion
         except Exception as ex:
             print("An error occurred while executing the task:", ex)
         finish = datetime.now()